@@ -0,0 +1,486 @@
+"""Typer application: command signatures and help only.
+
+Implementations live in crudfull.commands and are imported when a command
+runs, so --help and cheap commands never load jinja2 or inflect.
+"""
+import typer
+from . import __version__
+from .console import show_logo
+
+# ===========================
+# APP ROOT
+# ===========================
+
+app = typer.Typer(
+    help="🚀 crudfull - FastAPI CRUD Generator with superpowers",
+    no_args_is_help=True,
+    rich_markup_mode="rich",
+)
+
+generate_app = typer.Typer(
+    help="📦 Generate CRUD resources (models, schemas, services, routers, tests)",
+    no_args_is_help=True,
+)
+app.add_typer(generate_app, name="generate")
+app.add_typer(generate_app, name="gen", hidden=True)  # Alias
+app.add_typer(generate_app, name="g", hidden=True)    # Alias
+
+add_app = typer.Typer(
+    help="➕ Add features to your project (auth, middleware, etc.)",
+    no_args_is_help=True,
+)
+app.add_typer(add_app, name="add")
+app.add_typer(add_app, name="a", hidden=True)  # Alias
+
+version_app = typer.Typer(
+    help="ℹ️  Show crudfull version information",
+    no_args_is_help=True,
+)
+app.add_typer(version_app, name="version")
+app.add_typer(version_app, name="v", hidden=True)  # Alias
+
+sync_app = typer.Typer(
+    help="🔄 Sync routers in main.py automatically",
+    no_args_is_help=True,
+)
+app.add_typer(sync_app, name="sync-routers")
+app.add_typer(sync_app, name="sync", hidden=True)  # Alias
+
+cache_app = typer.Typer(
+    help="🗃️  Manage the compiled template cache",
+    no_args_is_help=True,
+)
+app.add_typer(cache_app, name="cache")
+
+profile_app = typer.Typer(
+    help="⏱️  Profile generated projects (startup, imports)",
+    no_args_is_help=True,
+)
+app.add_typer(profile_app, name="profile")
+
+
+
+# ===========================
+# CALLBACK TO SHOW LOGO
+# ===========================
+@app.callback()
+def main_callback():
+    """Show the logo at the start of any command."""
+    show_logo()
+
+
+# ===========================
+# ADD AUTH
+# ===========================
+@add_app.command("auth")
+def add_auth(
+    auth_type: str = typer.Option(
+        "jwt", 
+        "--type", "-t",
+        help="Tipo de autenticación: jwt | oauth2 | session"
+    ),
+    principal: str = typer.Option(
+        "db",
+        "--principal", "-p",
+        help="get_current_user: db (consulta por request) | cache (cache TTL/LRU por proceso) | claims (solo el token, sin consultas)"
+    ),
+):
+    """
+    🔐 Agrega autenticación completa al proyecto actual.
+    
+    Genera:
+    - Módulo de autenticación (app/auth/)
+    - Modelos de usuario
+    - Endpoints de login/register
+    - JWT token management
+    - Tests de autenticación
+    
+    Ejemplos:
+      crudfull add auth
+      crudfull add auth --type jwt
+      crudfull a auth -t oauth2
+      crudfull add auth --principal cache
+    """
+    from .commands import auth
+    auth.add_auth(auth_type, principal)
+
+
+# ===========================
+# ADD MIGRATIONS
+# ===========================
+@add_app.command("migrations")
+def add_migrations():
+    """
+    🧬 Agrega migraciones con Alembic (solo proyectos SQL).
+
+    Genera alembic.ini, migrations/ con una revisión inicial de las tablas
+    actuales y desactiva create_all() al arrancar (DB_AUTO_CREATE_TABLES=false).
+    Desde entonces cada 'crudfull generate resource' escribe una revisión nueva
+    con los cambios de esquema.
+
+    Ejemplos:
+      crudfull add migrations
+      alembic upgrade head
+    """
+    from .commands import migrations
+    migrations.add_migrations()
+
+
+# ===========================
+# NEW PROJECT
+# ===========================
+@app.command("new")
+@app.command("n", hidden=True)  # Alias
+def new_project(
+    name: str = typer.Argument(..., help="Nombre del proyecto"),
+    db: str = typer.Option(
+        "sql", 
+        "--db", "-d",
+        help="Motor de base de datos: ghost (sin DB) | sql (PostgreSQL) | mongo (MongoDB)"
+    ),
+    docker: bool = typer.Option(
+        False, 
+        "--docker",
+        help="Incluir Dockerfile y docker-compose.yml para producción"
+    ),
+    fast_json: bool = typer.Option(
+        False,
+        "--fast-json",
+        help="Respuestas JSON rápidas (ORJSONResponse + serialización sin doble validación) en todos los recursos"
+    ),
+):
+    """
+    ✨ Crea un nuevo proyecto FastAPI con arquitectura modular.
+    
+    Genera:
+    - Estructura de proyecto completa
+    - Configuración de base de datos
+    - Docker setup (opcional)
+    - Tests configurados
+    - README con instrucciones
+    
+    Ejemplos:
+      crudfull new mi_api
+      crudfull new mi_api --db mongo
+      crudfull new mi_api --db sql --docker
+      crudfull n mi_api -d ghost
+      crudfull new mi_api --fast-json
+    """
+    from .commands import project
+    project.new_project(name, db, docker, fast_json)
+
+
+# ===========================
+# VERSION
+# ===========================
+@version_app.command("show")
+def show_version():
+    """
+    ℹ️  Muestra la versión instalada de crudfull.
+    
+    Ejemplo:
+      crudfull version show
+      crudfull v show
+    """
+    typer.echo(f"crudfull v{__version__}")
+
+
+# ===========================
+# GENERATE RESOURCE (MODULAR DEFAULT)
+# ===========================
+@generate_app.command("resource")
+@generate_app.command("r", hidden=True)   # Alias
+@generate_app.command("res", hidden=True) # Alias
+def generate_resource(
+    name: str = typer.Argument(
+        ..., 
+        help="Nombre del recurso en plural (ej: users, products, posts)"
+    ),
+    fields: list[str] = typer.Argument(
+        ..., 
+        help="Campos en formato nombre:tipo[?][!index][!filter][!sort] (ej: name:str email:str!index status:str!filter)"
+    ),
+    db: str = typer.Option(
+        None, 
+        "--db", "-d",
+        help="Forzar motor de DB: ghost | sql | mongo (usa config del proyecto por defecto)"
+    ),
+    force: bool = typer.Option(
+        False, 
+        "--force", "-f", 
+        help="Regenerar aunque nada haya cambiado y sobrescribir archivos editados a mano"
+    ),
+    page_size: int = typer.Option(
+        50,
+        "--page-size",
+        help="Tamaño de página por defecto en los listados (paginación por cursor)"
+    ),
+    max_page_size: int = typer.Option(
+        500,
+        "--max-page-size",
+        help="Tamaño de página máximo que un cliente puede pedir con ?limit="
+    ),
+    bulk_batch_size: int = typer.Option(
+        500,
+        "--bulk-batch-size",
+        help="Filas por sentencia/bulk_write en los endpoints /bulk"
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Envolver el servicio en un cache read-through (memoria o Redis) con invalidación en escrituras"
+    ),
+    fast_json: bool = typer.Option(
+        None,
+        "--fast-json/--no-fast-json",
+        help="Serializar respuestas con pydantic-core/orjson sin validar dos veces (por defecto: config del proyecto)"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs", "-j",
+        help="Procesos para renderizar recursos en paralelo (0 = todos los CPUs); la salida es idéntica a -j 1"
+    ),
+):
+    """
+    📦 Genera un recurso CRUD completo con toda la arquitectura.
+    
+    Genera:
+    - Models (SQLAlchemy/Beanie/Ghost)
+    - Schemas (Pydantic)
+    - Service (lógica de negocio)
+    - Router (endpoints REST)
+    - Tests completos
+    
+    Tipos soportados:
+      str, int, float, bool, datetime, uuid
+      Agregar '?' al final para campos opcionales (ej: bio:str?)
+    
+    Los listados se paginan por cursor: GET /users/?limit=50&after=<next_cursor>
+    Alta/edición/baja masiva: POST | PATCH | DELETE /users/bulk
+    Con --cache, los GET se sirven desde cache (CACHE_BACKEND=memory | redis)
+    
+    Ejemplos:
+      crudfull generate resource users name:str email:str age:int
+      crudfull gen resource products title:str price:float stock:int description:str?
+      crudfull g r posts title:str content:str + users name:str email:str
+      crudfull g r logs message:str --page-size 100 --max-page-size 1000
+      crudfull g r products title:str price:float --cache
+      crudfull g r products title:str price:float --fast-json
+    """
+    from .commands import generate
+    generate.generate_resource(
+        name, fields, db, force, page_size, max_page_size, bulk_batch_size, cache, jobs, fast_json
+    )
+
+
+@generate_app.command("from-spec")
+@generate_app.command("spec", hidden=True)  # Alias
+def generate_from_spec(
+    spec_path: str = typer.Argument(
+        ...,
+        help="Archivo de esquema (.yaml, .yml o .json)"
+    ),
+    db: str = typer.Option(
+        None,
+        "--db", "-d",
+        help="Forzar motor de DB: ghost | sql | mongo (por defecto: el del spec o el del proyecto)"
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force", "-f",
+        help="Regenerar todo y sobrescribir archivos editados a mano"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs", "-j",
+        help="Procesos para renderizar recursos en paralelo (0 = todos los CPUs); la salida es idéntica a -j 1"
+    ),
+):
+    """
+    🗂️  Genera todos los recursos de un archivo de esquema en un solo proceso.
+
+    main.py (y session.py en MongoDB) se actualizan una sola vez al final.
+
+    Formato (YAML o el equivalente en JSON):
+
+      db: sql
+      defaults:
+        page_size: 50
+        cache: false
+      resources:
+        products:
+          fields:
+            name: str
+            price: float
+            status: str!filter
+          cache: true
+        users:
+          fields: [name:str, email:str!index]
+
+    Ejemplos:
+      crudfull generate from-spec schema.yaml
+      crudfull g from-spec schema.json --db mongo
+      crudfull g from-spec schema.yaml --jobs 8
+    """
+    from .commands import generate
+    generate.generate_from_spec(spec_path, db, force, jobs)
+
+@sync_app.command("run")
+def sync_routers(
+    registry: bool = typer.Option(
+        False,
+        "--registry",
+        help="Generar app/routers.py (un solo api_router, import lazy con LAZY_ROUTERS=true) en lugar de un import por recurso en main.py"
+    ),
+):
+    """
+    🔄 Sincroniza todos los routers en main.py automáticamente.
+    
+    Escanea:
+    - app/*/router.py (arquitectura modular)
+    - routers/*_router.py (arquitectura legacy)
+    
+    Y los registra automáticamente en main.py.
+
+    Con --registry los routers modulares se registran en app/routers.py y
+    main.py solo llama a include_routers(app). Desde entonces, generate y
+    sync-routers actualizan el registro.
+    
+    Ejemplo:
+      crudfull sync-routers run
+      crudfull sync run --registry
+    """
+    from .commands import routers
+    routers.sync_routers(registry)
+
+
+
+# ===========================
+# PROTECT ROUTES
+# ===========================
+# ===========================
+# PROTECT ROUTES
+# ===========================
+@app.command("protect")
+def protect(
+    resource: str = typer.Argument(
+        ..., 
+        help="Nombre del recurso a proteger (ej: users, products)"
+    ),
+    action: str = typer.Argument(
+        None, 
+        help="Acción específica: list | create | read | update | delete | all"
+    ),
+    func_name: str = typer.Option(
+        None, 
+        "--func", "--fn",
+        help="Nombre específico de la función a proteger (ej: create_user)"
+    ),
+):
+    """
+    🔒 Protege rutas con autenticación JWT.
+    
+    Agrega Depends(get_current_user) a los endpoints especificados.
+    Requiere haber ejecutado 'crudfull add auth' primero.
+    
+    Ejemplos:
+      crudfull protect users all
+      crudfull protect products create
+      crudfull protect posts update
+      crudfull protect users --func create_user
+      crudfull protect posts --fn create_post
+    """
+    from .commands import protect
+    protect.protect(resource, action, func_name)
+
+
+# ===========================
+# SYNC MODELS
+# ===========================
+@app.command("sync-models")
+def sync_models():
+    """
+    🔄 Regenera el registro de modelos (app/db/models_registry.py).
+    
+    Escanea todos los archivos app/*/models.py y registra las clases de
+    modelos (SQLAlchemy Base o Beanie Document) que init_db importa al arrancar.
+    
+    En proyectos MongoDB anteriores (sin registro) actualiza app/db/session.py.
+    
+    Ejemplo:
+      crudfull sync-models
+    """
+    from .commands import models
+    models.sync_models()
+
+
+# ===========================
+# TEMPLATE CACHE
+# ===========================
+@cache_app.command("precompile")
+def cache_precompile():
+    """
+    ⚡ Compila todas las plantillas y guarda el bytecode en disco.
+
+    Pensado para correr una vez tras instalar (CI, imágenes Docker):
+      pip install crudfull && crudfull cache precompile
+    """
+    from .commands import cache
+    cache.cache_precompile()
+
+
+@cache_app.command("clear")
+def cache_clear():
+    """
+    🧹 Borra el bytecode compilado de esta versión de crudfull.
+    """
+    from .commands import cache
+    cache.cache_clear()
+
+
+# ===========================
+# PROFILE
+# ===========================
+@profile_app.command("startup")
+def profile_startup(
+    target: str = typer.Argument(
+        "app.main:app",
+        help="App a perfilar, en formato modulo:variable"
+    ),
+    json_path: str = typer.Option(
+        None,
+        "--json",
+        help="Guardar el reporte completo en un archivo JSON (para CI)"
+    ),
+    budget_ms: float = typer.Option(
+        None,
+        "--budget-ms",
+        help="Fallar (exit 1) si el cold start supera estos milisegundos"
+    ),
+    lifespan: bool = typer.Option(
+        True,
+        "--lifespan/--no-lifespan",
+        help="Ejecutar el lifespan (init_db) además del import"
+    ),
+    top: int = typer.Option(
+        15,
+        "--top",
+        help="Cantidad de módulos y paquetes a mostrar"
+    ),
+):
+    """
+    ⏱️  Mide cuánto tarda en arrancar la app generada.
+
+    Importa la app en un proceso nuevo (python -X importtime) y reporta:
+    - Tiempo de import por módulo del proyecto y por paquete
+    - Construcción de la tabla de rutas
+    - Lifespan (init_db) y módulos importados durante el mismo
+    - Esquema OpenAPI
+
+    Ejemplos:
+      crudfull profile startup
+      crudfull profile startup --json startup.json --budget-ms 800
+      crudfull profile startup --no-lifespan
+    """
+    from .commands import profile
+    profile.profile_startup(target, json_path, budget_ms, lifespan, top)
@@ -0,0 +1 @@
+"""Command implementations, imported lazily by crudfull.app."""
@@ -0,0 +1,160 @@
+"""crudfull add auth"""
+import os
+import typer
+from ..console import warning
+from ..generator import write_schema_migration
+from ..helpers import write_file, add_router_to_main, add_model_to_session
+from ..migrations import migrations_enabled, parse_table
+from ..rendering import render_template
+
+HASHING_SETTINGS = """
+# Password hashing (app/core/hashing.py): bcrypt cost and concurrent hashes per worker
+PASSWORD_HASH_ROUNDS=12
+PASSWORD_HASH_WORKERS=4
+PASSWORD_HASH_EXECUTOR=thread
+"""
+
+
+def _add_hashing_settings(env_path: str):
+    if not os.path.exists(env_path):
+        return
+    with open(env_path, "r") as f:
+        content = f.read()
+    if "PASSWORD_HASH_ROUNDS" not in content:
+        with open(env_path, "a") as f:
+            f.write(HASHING_SETTINGS)
+
+
+# ===========================
+# ADD AUTH
+# ===========================
+PRINCIPAL_MODES = ("db", "cache", "claims")
+
+
+def add_auth(auth_type: str, principal: str = "db"):
+    if principal not in PRINCIPAL_MODES:
+        typer.echo(f"❌ --principal debe ser uno de: {', '.join(PRINCIPAL_MODES)}")
+        raise typer.Exit(code=1)
+    typer.echo(f"🔐 Agregando autenticación ({auth_type}) al proyecto...")
+    
+    # Check if we're in a crudfull project
+    config_path = os.path.join(os.getcwd(), "crudfull.json")
+    if not os.path.exists(config_path):
+        typer.echo("❌ No se encontró crudfull.json. ¿Estás en un proyecto crudfull?")
+        typer.echo("💡 Tip: Ejecutá 'crudfull new mi_proyecto' primero")
+        raise typer.Exit(code=1)
+    
+    # Read project config
+    import json
+    with open(config_path, "r") as f:
+        config = json.load(f)
+    
+    db = config.get("db", "sql")
+    
+    context = {
+        "db": db,
+        "auth_type": auth_type,
+        "principal": principal,
+    }
+    
+    # Create auth module directory
+    auth_dir = os.path.join("app", "auth")
+    os.makedirs(auth_dir, exist_ok=True)
+    write_file(auth_dir, "__init__.py", "")
+    
+    # Create core directory for security config
+    core_dir = os.path.join("app", "core")
+    os.makedirs(core_dir, exist_ok=True)
+    write_file(core_dir, "__init__.py", "")
+    
+    # Generate auth files
+    schemas_content = render_template("auth/schemas.jinja2", context)
+    write_file(auth_dir, "schemas.py", schemas_content)
+    
+    models_content = render_template("auth/models.jinja2", context)
+    write_file(auth_dir, "models.py", models_content)
+    
+    service_content = render_template("auth/service.jinja2", context)
+    write_file(auth_dir, "service.py", service_content)
+    
+    router_content = render_template("auth/router.jinja2", context)
+    write_file(auth_dir, "router.py", router_content)
+    
+    dependencies_content = render_template("auth/dependencies.jinja2", context)
+    write_file(auth_dir, "dependencies.py", dependencies_content)
+
+    if principal == "cache":
+        principal_cache_content = render_template("auth/principal_cache.jinja2", context)
+        write_file(auth_dir, "principal_cache.py", principal_cache_content)
+    
+    security_content = render_template("auth/security.jinja2", context)
+    write_file(core_dir, "security.py", security_content)
+
+    hashing_content = render_template("auth/hashing.jinja2", context)
+    write_file(core_dir, "hashing.py", hashing_content)
+    
+    # Generate Auth Tests
+    test_auth_dir = os.path.join("tests", "auth")
+    os.makedirs(test_auth_dir, exist_ok=True)
+    write_file(test_auth_dir, "__init__.py", "")
+    
+    test_auth_content = render_template("auth/test_auth.jinja2", context)
+    write_file(test_auth_dir, "test_auth.py", test_auth_content)
+
+    test_load_content = render_template("auth/test_auth_load.jinja2", context)
+    write_file(test_auth_dir, "test_auth_load.py", test_load_content)
+    
+    # Auto-register router in main.py
+    add_router_to_main("auth", "app.auth.router")
+    
+    # Auto-register the User model (models registry, or session.py in older MongoDB projects)
+    if db in ("sql", "mongo"):
+        add_model_to_session("User", "app.auth.models")
+
+    # users table as a new revision when the project has `crudfull add migrations`
+    if db == "sql" and migrations_enabled():
+        write_schema_migration([(None, parse_table(os.path.join(auth_dir, "models.py")))])
+
+    # Update requirements.txt
+    req_path = os.path.join(os.getcwd(), "requirements.txt")
+    if os.path.exists(req_path):
+        with open(req_path, "r") as f:
+            req_content = f.read()
+        
+        new_deps = []
+        if "pydantic[email]" not in req_content and "email-validator" not in req_content:
+            # Replace pydantic with pydantic[email] if present, else add it
+            if "pydantic" in req_content and "pydantic[email]" not in req_content:
+                req_content = req_content.replace("pydantic", "pydantic[email]")
+                typer.echo("📦 Actualizado 'pydantic' a 'pydantic[email]' en requirements.txt")
+            else:
+                new_deps.append("pydantic[email]")
+        
+        auth_deps = ["python-jose[cryptography]", "bcrypt", "python-multipart"]
+        for dep in auth_deps:
+            if dep.split("[")[0] not in req_content: # Check base name
+                new_deps.append(dep)
+        
+        if new_deps:
+            with open(req_path, "a") as f:
+                f.write("\n" + "\n".join(new_deps) + "\n")
+            typer.echo(f"📦 Dependencias agregadas a requirements.txt: {', '.join(new_deps)}")
+    else:
+        warning("⚠️  No se encontró requirements.txt. Asegúrate de instalar: pydantic[email], python-jose[cryptography], bcrypt, python-multipart")
+
+    _add_hashing_settings(".env.example")
+
+    typer.echo("\n✅ Módulo de autenticación generado exitosamente!")
+    typer.echo(f"📂 app/auth/ - Módulo de autenticación")
+    typer.echo(f"📂 app/core/security.py - Configuración JWT")
+    if principal == "cache":
+        typer.echo(f"📂 app/auth/principal_cache.py - Cache de usuarios autenticados (AUTH_PRINCIPAL_CACHE_TTL)")
+    elif principal == "claims":
+        typer.echo("🪪 get_current_user arma el usuario desde el token, sin consultar la base")
+    typer.echo(f"📂 app/core/hashing.py - bcrypt fuera del event loop (PASSWORD_HASH_ROUNDS / PASSWORD_HASH_WORKERS)")
+    typer.echo("\n📝 Próximos pasos:")
+    typer.echo("1. Instalar dependencias: pip install 'crudfull[auth]'")
+    typer.echo("2. Proteger rutas con:")
+    typer.echo("   from app.auth.dependencies import get_current_user")
+    typer.echo("   @router.get('/protected')")
+    typer.echo("   async def protected(user = Depends(get_current_user)):")
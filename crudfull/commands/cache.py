@@ -0,0 +1,24 @@
+"""crudfull cache precompile | clear"""
+import typer
+from ..console import error, success
+from ..rendering import get_template_env, template_cache_dir
+
+# ===========================
+# TEMPLATE CACHE
+# ===========================
+def cache_precompile():
+    env = get_template_env()
+    if env.bytecode_cache is None:
+        error("❌ Cache de plantillas deshabilitado o no escribible")
+        raise typer.Exit(code=1)
+    names = env.list_templates(filter_func=lambda name: name.endswith(".jinja2"))
+    for name in names:
+        env.get_template(name)
+    success(f"✅ {len(names)} plantillas compiladas en {template_cache_dir()}")
+
+
+def cache_clear():
+    env = get_template_env()
+    if env.bytecode_cache is not None:
+        env.bytecode_cache.clear()
+    success(f"✅ Cache limpiado: {template_cache_dir()}")
@@ -0,0 +1,95 @@
+"""crudfull generate resource | from-spec"""
+import typer
+from ..console import error, success
+from ..generator import (
+    generate_resources, load_spec, resolve_jobs, resolve_project_db, resolve_project_fast_json,
+    validate_generation_options,
+    SPEC_OPTIONS, _spec_fields,
+)
+
+# ===========================
+# GENERATE RESOURCE (MODULAR DEFAULT)
+# ===========================
+def generate_resource(
+    name: str,
+    fields: list[str],
+    db: str,
+    force: bool,
+    page_size: int,
+    max_page_size: int,
+    bulk_batch_size: int,
+    cache: bool,
+    jobs: int,
+    fast_json: bool | None = None,
+):
+    db = resolve_project_db(db)
+    validate_generation_options(page_size, max_page_size, bulk_batch_size)
+
+    # Parse multiple resources
+    resources_to_generate = []
+    current_resource_name = name
+    current_fields = []
+
+    for item in fields:
+        if item == "+":
+            # Save current resource
+            resources_to_generate.append({
+                "name": current_resource_name,
+                "fields": current_fields
+            })
+            # Reset for next (will be set by next iteration logic, but we need to handle the name)
+            current_resource_name = None 
+            current_fields = []
+        elif current_resource_name is None:
+            # This item is the name of the next resource
+            current_resource_name = item
+        else:
+            # This item is a field
+            current_fields.append(item)
+    
+    # Append the last resource
+    if current_resource_name:
+        resources_to_generate.append({
+            "name": current_resource_name,
+            "fields": current_fields
+        })
+
+    # Generate each resource, then patch main.py / session.py once
+    options = {
+        "page_size": page_size, "max_page_size": max_page_size,
+        "bulk_batch_size": bulk_batch_size, "cache": cache,
+        "fast_json": resolve_project_fast_json(fast_json),
+    }
+    generate_resources(
+        [(res["name"], res["fields"], options) for res in resources_to_generate],
+        db, jobs=resolve_jobs(jobs), force=force,
+    )
+
+
+def generate_from_spec(spec_path: str, db: str, force: bool, jobs: int):
+    spec = load_spec(spec_path)
+    db = resolve_project_db(db or spec.get("db"))
+
+    defaults = {**SPEC_OPTIONS, "fast_json": resolve_project_fast_json(None), **(spec.get("defaults") or {})}
+    unknown = set(defaults) - set(SPEC_OPTIONS)
+    if unknown:
+        error(f"❌ Opciones desconocidas en 'defaults': {', '.join(sorted(unknown))}")
+        raise typer.Exit(code=1)
+
+    # Validate the whole spec before writing anything
+    resources = []
+    for name, resource in spec["resources"].items():
+        resource = resource or {}
+        if not isinstance(resource, dict):
+            error(f"❌ Recurso '{name}': se esperaba un mapa con 'fields'")
+            raise typer.Exit(code=1)
+        options = {**defaults, **{k: v for k, v in resource.items() if k != "fields"}}
+        unknown = set(options) - set(SPEC_OPTIONS)
+        if unknown:
+            error(f"❌ Recurso '{name}': opciones desconocidas: {', '.join(sorted(unknown))}")
+            raise typer.Exit(code=1)
+        validate_generation_options(options["page_size"], options["max_page_size"], options["bulk_batch_size"])
+        resources.append((name, _spec_fields(name, resource.get("fields")), options))
+
+    generated = generate_resources(resources, db, jobs=resolve_jobs(jobs), force=force)
+    success(f"✅ {len(generated)} recursos generados desde {spec_path}")
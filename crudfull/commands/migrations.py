@@ -0,0 +1,82 @@
+"""crudfull add migrations"""
+import json
+import os
+import re
+import typer
+from ..console import error, success
+from ..helpers import add_requirement, write_file, write_models_registry
+from ..migrations import MIGRATIONS_DIR, VERSIONS_DIR, project_tables, write_migration_for
+from ..rendering import render_template
+
+MIGRATIONS_TEST_PATH = os.path.join("tests", "test_migrations.py")
+
+
+def _disable_auto_create(env_path: str):
+    """DB_AUTO_CREATE_TABLES=false in an env file (replace the line or append it)."""
+    if not os.path.exists(env_path):
+        return
+    with open(env_path, "r") as f:
+        content = f.read()
+    line = "DB_AUTO_CREATE_TABLES=false"
+    if re.search(r"^DB_AUTO_CREATE_TABLES=.*$", content, flags=re.M):
+        content = re.sub(r"^DB_AUTO_CREATE_TABLES=.*$", line, content, flags=re.M)
+    else:
+        content = content.rstrip("\n") + f"\n\n# Schema managed by Alembic (alembic upgrade head)\n{line}\n"
+    with open(env_path, "w") as f:
+        f.write(content)
+    typer.echo(f"⚙️  {line} en {os.path.basename(env_path)}")
+
+
+# ===========================
+# ADD MIGRATIONS
+# ===========================
+def add_migrations():
+    typer.echo("🧬 Agregando migraciones (Alembic) al proyecto...")
+
+    config_path = os.path.join(os.getcwd(), "crudfull.json")
+    if not os.path.exists(config_path):
+        error("❌ No se encontró crudfull.json. ¿Estás en un proyecto crudfull?")
+        typer.echo("💡 Tip: Ejecutá 'crudfull new mi_proyecto' primero")
+        raise typer.Exit(code=1)
+    with open(config_path, "r") as f:
+        config = json.load(f)
+
+    if config.get("db", "sql") != "sql":
+        error("❌ Las migraciones con Alembic solo están disponibles para proyectos SQL")
+        raise typer.Exit(code=1)
+    if os.path.exists(MIGRATIONS_DIR):
+        error(f"❌ Ya existe la carpeta {MIGRATIONS_DIR}/")
+        raise typer.Exit(code=1)
+
+    context = {"project_name": config.get("project_name", os.path.basename(os.getcwd()))}
+    write_file(".", "alembic.ini", render_template("migrations/alembic_ini.jinja2", context))
+    os.makedirs(VERSIONS_DIR)
+    write_file(MIGRATIONS_DIR, "env.py", render_template("migrations/env.jinja2", context))
+    write_file(MIGRATIONS_DIR, "script.py.mako", render_template("migrations/script_py_mako.jinja2", {}))
+    write_file(MIGRATIONS_DIR, "README", "Alembic migrations. New revisions are written by `crudfull generate resource`.\n")
+
+    # env.py imports the registry to load every model on Base.metadata
+    write_models_registry()
+
+    tables = project_tables()
+    path = write_migration_for([(None, table) for table in tables], "initial schema", "initial")
+    if path:
+        success(f"✅ Migración inicial: {path} ({len(tables)} tablas)")
+    else:
+        typer.echo("ℹ️  Sin tablas todavía: la primera migración se creará con 'crudfull generate resource'")
+
+    if os.path.isdir("tests"):
+        write_file("tests", "test_migrations.py", render_template("migrations/test_migrations.jinja2", context))
+
+    add_requirement("alembic")
+
+    for env_file in (".env.example", ".env"):
+        _disable_auto_create(env_file)
+
+    typer.echo("\n✅ Migraciones configuradas!")
+    typer.echo("📂 alembic.ini, migrations/ - Configuración y revisiones de Alembic")
+    typer.echo("\n📝 Próximos pasos:")
+    typer.echo("1. Instalar dependencias: pip install alembic")
+    typer.echo("2. Crear las tablas: alembic upgrade head")
+    typer.echo("   Base de datos existente (creada con create_all): alembic stamp head")
+    typer.echo("3. Cada 'crudfull generate resource' agrega una revisión en migrations/versions/")
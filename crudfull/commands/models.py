@@ -0,0 +1,71 @@
+"""crudfull sync-models"""
+import os
+import typer
+from ..console import success, warning, error
+from ..helpers import MODELS_REGISTRY_PATH, write_models_registry
+from ..patcher import PatchError, model_classes, register_models
+
+# ===========================
+# SYNC MODELS
+# ===========================
+def sync_models():
+    # Projects with an explicit registry (SQL and MongoDB): regenerate it from disk
+    if os.path.exists(MODELS_REGISTRY_PATH):
+        models = write_models_registry()
+        if not models:
+            warning("⚠️  No se encontraron modelos en app/*/models.py")
+            typer.echo("💡 Tip: Generá recursos primero con 'crudfull generate resource'")
+            raise typer.Exit(code=0)
+        success(f"✅ {len(models)} modelo(s) registrado(s) en {MODELS_REGISTRY_PATH}:")
+        for class_name, module in models:
+            typer.echo(f"   - {class_name} ({module})")
+        return
+
+    # Older MongoDB projects: imports and document_models = [...] in session.py
+    session_path = os.path.join("app", "db", "session.py")
+    
+    if not os.path.exists(session_path):
+        error("❌ No se encontró app/db/session.py")
+        typer.echo("💡 Tip: Ejecutá este comando desde la raíz del proyecto")
+        raise typer.Exit(code=1)
+    
+    # Find all model files in app/*/models.py
+    import glob
+    model_files = sorted(glob.glob(os.path.join("app", "*", "models.py")))
+    
+    if not model_files:
+        warning("⚠️  No se encontraron archivos models.py")
+        typer.echo("💡 Tip: Generá recursos primero con 'crudfull generate resource'")
+        raise typer.Exit(code=0)
+    
+    # Document subclasses of every app/<module>/models.py
+    models_to_import = []
+    for model_file in model_files:
+        module_name = model_file.split(os.sep)[1]  # 'users' from app/users/models.py
+        try:
+            class_names = model_classes(model_file)
+        except PatchError as e:
+            warning(f"⚠️  Se omite {model_file}: {e}")
+            continue
+        for class_name in class_names:
+            models_to_import.append((class_name, f"app.{module_name}.models"))
+    
+    if not models_to_import:
+        warning("⚠️  No se encontraron modelos Document en los archivos")
+        raise typer.Exit(code=0)
+    
+    # Rewrite the model imports and document_models = [...] in one pass
+    try:
+        registered = register_models(session_path, models_to_import, replace=True)
+    except PatchError as e:
+        error(f"❌ {e}")
+        typer.echo("ℹ️  Se busca una variable 'document_models = ...' dentro de app/db/session.py")
+        raise typer.Exit(code=1)
+
+    if registered is None:
+        error("❌ Este proyecto no usa MongoDB/Beanie")
+        raise typer.Exit(code=1)
+    
+    success(f"✅ {len(models_to_import)} modelo(s) registrado(s) en app/db/session.py:")
+    for class_name, module in models_to_import:
+        typer.echo(f"   - {class_name} ({module})")
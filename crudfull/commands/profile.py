@@ -0,0 +1,127 @@
+"""crudfull profile startup"""
+import json
+import os
+import subprocess
+import sys
+import typer
+from ..console import error, success, warning
+from ..startup_probe import RESULT_MARKER
+
+# ===========================
+# PROFILE STARTUP
+# ===========================
+def parse_importtime(stderr: str) -> list[dict]:
+    """`-X importtime` lines as {module, depth, self_ms, cumulative_ms}, in import order."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        stripped = name.lstrip()
+        modules.append({
+            "module": stripped.rstrip(),
+            "depth": (len(name) - len(stripped) - 1) // 2,
+            "self_ms": int(self_us) / 1e3,
+            "cumulative_ms": int(cumulative_us) / 1e3,
+        })
+    return modules
+
+
+def summarize(result: dict, modules: list[dict], project_package: str, top: int) -> dict:
+    project = [
+        m for m in modules
+        if m["module"] == project_package or m["module"].startswith(project_package + ".")
+    ]
+    packages: dict[str, float] = {}
+    for m in modules:
+        root = m["module"].split(".")[0]
+        packages[root] = packages.get(root, 0.0) + m["self_ms"]
+
+    result["cold_start_ms"] = round(
+        result["import_ms"] + result["middleware_ms"] + result.get("lifespan_startup_ms", 0.0), 3
+    )
+    result["project_modules"] = sorted(project, key=lambda m: m["cumulative_ms"], reverse=True)[:top]
+    result["packages"] = [
+        {"package": name, "self_ms": round(ms, 3)}
+        for name, ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    ]
+    return result
+
+
+def print_report(report: dict):
+    typer.echo(f"\n⏱️  Arranque de {report['target']} ({report['routes']} rutas)\n")
+    rows = [
+        ("Import (app + dependencias)", report["import_ms"]),
+        ("  └ Tabla de rutas (add_api_route)", report["route_build_ms"]),
+        ("Middleware stack", report["middleware_ms"]),
+        ("Lifespan startup", report.get("lifespan_startup_ms")),
+        ("  └ init_db", report.get("init_db_ms")),
+        ("Lifespan shutdown", report.get("lifespan_shutdown_ms")),
+        ("OpenAPI schema (primer /docs)", report["openapi_ms"]),
+    ]
+    for label, ms in rows:
+        if ms is not None:
+            typer.echo(f"  {label:<44} {ms:9.1f} ms")
+    typer.echo(f"  {'Cold start (import + middleware + lifespan)':<44} {report['cold_start_ms']:9.1f} ms")
+
+    if report.get("lifespan_error"):
+        warning(f"\n⚠️  El lifespan falló: {report['lifespan_error']}")
+    imported = report.get("lifespan_imported_modules", [])
+    if imported:
+        typer.echo(f"\n📦 Módulos importados durante el lifespan: {len(imported)}")
+        for name in imported[:10]:
+            typer.echo(f"   - {name}")
+
+    typer.echo("\n🐢 Módulos del proyecto más lentos (acumulado / propio):")
+    for m in report["project_modules"]:
+        typer.echo(f"  {m['cumulative_ms']:9.1f} ms {m['self_ms']:8.1f} ms  {m['module']}")
+
+    typer.echo("\n📚 Tiempo propio por paquete:")
+    for p in report["packages"]:
+        typer.echo(f"  {p['self_ms']:9.1f} ms  {p['package']}")
+
+
+def profile_startup(
+    target: str = "app.main:app",
+    json_path: str | None = None,
+    budget_ms: float | None = None,
+    lifespan: bool = True,
+    top: int = 15,
+):
+    module_name = target.partition(":")[0]
+    module_file = os.path.join(*module_name.split(".")) + ".py"
+    if not os.path.exists(module_file):
+        error(f"❌ No se encontró {module_file}")
+        typer.echo("💡 Tip: Ejecutá este comando desde la raíz del proyecto")
+        raise typer.Exit(code=1)
+
+    # Fresh interpreter: project first on the path, then wherever crudfull lives
+    crudfull_parent = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    python_path = [os.getcwd(), crudfull_parent, os.environ.get("PYTHONPATH", "")]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, python_path))}
+    argv = [sys.executable, "-X", "importtime", "-m", "crudfull.startup_probe", target]
+    if not lifespan:
+        argv.append("--no-lifespan")
+
+    typer.echo(f"🔬 Importando {target} en un proceso nuevo...")
+    proc = subprocess.run(argv, env=env, capture_output=True, text=True)
+    lines = [line for line in proc.stdout.splitlines() if line.startswith(RESULT_MARKER)]
+    if proc.returncode != 0 or not lines:
+        error(f"❌ No se pudo importar {target}:")
+        typer.echo("\n".join(l for l in proc.stderr.splitlines() if not l.startswith("import time:"))[-2000:])
+        raise typer.Exit(code=1)
+
+    result = json.loads(lines[-1][len(RESULT_MARKER):])
+    report = summarize(result, parse_importtime(proc.stderr), module_name.split(".")[0], top)
+    print_report(report)
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        success(f"\n📝 Reporte JSON: {json_path}")
+
+    if budget_ms is not None:
+        if report["cold_start_ms"] > budget_ms:
+            error(f"\n❌ Cold start {report['cold_start_ms']:.1f} ms supera el presupuesto de {budget_ms:.0f} ms")
+            raise typer.Exit(code=1)
+        success(f"\n✅ Cold start {report['cold_start_ms']:.1f} ms dentro del presupuesto de {budget_ms:.0f} ms")
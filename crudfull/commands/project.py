@@ -0,0 +1,142 @@
+"""crudfull new"""
+import os
+import typer
+from ..helpers import write_file
+from ..rendering import TEMPLATES_DIR, render_template
+
+# ===========================
+# NEW PROJECT
+# ===========================
+def new_project(name: str, db: str, docker: bool, fast_json: bool = False):
+    typer.echo(f"✨ Creando nuevo proyecto: {name} (DB: {db})")
+
+    project_dir = os.path.join(os.getcwd(), name)
+    if os.path.exists(project_dir):
+        typer.echo(f"❌ El directorio {name} ya existe.")
+        raise typer.Exit(code=1)
+
+    # Create directories
+    os.makedirs(project_dir)
+    os.makedirs(os.path.join(project_dir, "app"))
+    os.makedirs(os.path.join(project_dir, "app", "db"))
+    os.makedirs(os.path.join(project_dir, "tests"))
+
+    context = {
+        "project_name": name,
+        "db": db,
+        "fast_json": fast_json,
+        "docker": docker,
+    }
+
+    # Render and write files
+    # 0. Root __init__.py (to make app importable)
+    write_file(name, "__init__.py", "")
+    
+    # 1. main.py
+    main_content = render_template("project/main.jinja2", context)
+    write_file(os.path.join(name, "app"), "main.py", main_content)
+    write_file(os.path.join(name, "app"), "__init__.py", "")
+    
+    # 1.1 welcome.html
+    welcome_content = render_template("project/welcome.html.jinja2", context)
+    write_file(os.path.join(name, "app"), "welcome.html", welcome_content)
+
+    # 2. Database setup
+    if db == "sql":
+        db_content = render_template("project/database_sql.jinja2", context)
+        write_file(os.path.join(name, "app", "db"), "session.py", db_content)
+        write_file(os.path.join(name, "app", "db"), "__init__.py", "")
+    elif db == "mongo":
+        db_content = render_template("project/database_mongo.jinja2", context)
+        write_file(os.path.join(name, "app", "db"), "session.py", db_content)
+        write_file(os.path.join(name, "app", "db"), "__init__.py", "")
+
+    if db in ("sql", "mongo"):
+        # Filled in by generate resource / add auth / sync-models
+        registry_content = render_template("project/models_registry.jinja2", {"models": []})
+        write_file(os.path.join(name, "app", "db"), "models_registry.py", registry_content)
+    
+    # 3.1 Test configuration (conftest.py)
+    conftest_content = render_template("project/conftest.jinja2", context)
+    write_file(os.path.join(name, "tests"), "conftest.py", conftest_content)
+    write_file(os.path.join(name, "tests"), "__init__.py", "")
+
+    # 3. Requirements
+    req_content = render_template("project/requirements.jinja2", context)
+    write_file(name, "requirements.txt", req_content)
+
+    # 4. Gitignore
+    git_content = render_template("project/gitignore.jinja2", context)
+    write_file(name, ".gitignore", git_content)
+
+    # 4.1 Pytest config
+    pytest_content = render_template("project/pytest.jinja2", context)
+    write_file(name, "pytest.ini", pytest_content)
+
+    # 4.2 README
+    readme_content = render_template("project/readme.jinja2", context)
+    write_file(name, "README.md", readme_content)
+
+    # 5. Docker files (optional)
+    if docker:
+        docker_compose_content = render_template("project/docker_compose.jinja2", context)
+        write_file(name, "docker-compose.yml", docker_compose_content)
+        
+        dockerfile_content = render_template("project/dockerfile.jinja2", context)
+        write_file(name, "Dockerfile", dockerfile_content)
+        write_file(name, ".dockerignore", render_template("project/dockerignore.jinja2", context))
+
+        gunicorn_content = render_template("project/gunicorn_conf.jinja2", context)
+        write_file(name, "gunicorn.conf.py", gunicorn_content)
+
+        load_test_content = render_template("project/load_test.jinja2", context)
+        write_file(os.path.join(name, "scripts"), "load_test.py", load_test_content)
+    
+    # 5.2 Env Example (always generated)
+    env_example_content = render_template("project/env_example.jinja2", context)
+    write_file(name, ".env.example", env_example_content)
+    
+    # 5.1 Docker Dev files (only if docker requested)
+    if docker and db != 'ghost':
+        docker_compose_dev_content = render_template("project/docker_compose_dev.jinja2", context)
+        write_file(name, "docker-compose.dev.yml", docker_compose_dev_content)
+        
+
+
+    # 6. Copy static assets (logos, CSS, etc.)
+    static_source = os.path.join(TEMPLATES_DIR, "project", "static")
+    if os.path.exists(static_source):
+        import shutil
+        static_dest = os.path.join(name, "static")
+        shutil.copytree(static_source, static_dest)
+        typer.echo(f"📁 Static assets copied to {static_dest}/")
+
+    typer.echo(f"\n🚀 Proyecto {name} creado exitosamente!")
+    typer.echo(f"📂 cd {name}")
+    if docker:
+        typer.echo("\n🐳 Modo Producción:")
+        typer.echo("   docker-compose up -d --build")
+    if docker and db != 'ghost':
+        typer.echo("\n🔧 Modo Desarrollo (solo DB):")
+        typer.echo("   cp .env.example .env")
+        typer.echo("   docker-compose -f docker-compose.dev.yml up -d")
+        typer.echo("   pip install -r requirements.txt")
+        typer.echo("   uvicorn app.main:app --reload")
+    if not docker:
+        if db != 'ghost':
+            typer.echo("\n⚠️  Nota: No se generaron archivos Docker.")
+            typer.echo("   Asegúrate de tener una base de datos corriendo.")
+            typer.echo("   cp .env.example .env  # Configura tus credenciales")
+        
+        typer.echo("\n📦 pip install -r requirements.txt")
+        typer.echo("▶️  uvicorn app.main:app --reload")
+    
+    # 6. Create crudfull.json config
+    config = {
+        "project_name": name,
+        "db": db,
+        "fast_json": fast_json,
+    }
+    import json
+    with open(os.path.join(name, "crudfull.json"), "w") as f:
+        json.dump(config, f, indent=2)
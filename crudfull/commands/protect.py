@@ -0,0 +1,156 @@
+"""crudfull protect"""
+import os
+import typer
+
+# ===========================
+# PROTECT ROUTES
+# ===========================
+# ===========================
+# PROTECT ROUTES
+# ===========================
+def protect(resource: str, action: str, func_name: str):
+    if not action and not func_name:
+        typer.echo("❌ Debes especificar una acción o usar --func <nombre>")
+        raise typer.Exit(code=1)
+
+    # Locate router
+    # Support both app/<resource>/router.py and routers/<resource>_router.py
+    modular_path = os.path.join("app", resource, "router.py")
+    legacy_path = os.path.join("routers", f"{resource}_router.py")
+    
+    if os.path.exists(modular_path):
+        router_path = modular_path
+    elif os.path.exists(legacy_path):
+        router_path = legacy_path
+    else:
+        typer.echo(f"❌ No se encontró el router para '{resource}'")
+        raise typer.Exit(code=1)
+
+    with open(router_path, "r") as f:
+        content = f.read()
+
+    # 1. Add Imports
+    modified_content = content
+    
+    if "from app.auth.dependencies import get_current_user" not in modified_content:
+        # Insert after imports
+        lines = modified_content.splitlines()
+        last_import_idx = 0
+        for i, line in enumerate(lines):
+            if line.startswith("from ") or line.startswith("import "):
+                last_import_idx = i
+        
+        lines.insert(last_import_idx + 1, "from app.auth.dependencies import get_current_user")
+        modified_content = "\n".join(lines)
+
+    if "Depends" not in modified_content:
+        # Try to append to fastapi import
+        if "from fastapi import " in modified_content:
+            modified_content = modified_content.replace("from fastapi import ", "from fastapi import Depends, ")
+        else:
+            # Fallback
+            modified_content = "from fastapi import Depends\n" + modified_content
+
+    lines = modified_content.splitlines()
+    new_lines = []
+    changes_made = False
+
+    # ---------------------------
+    # MODO 1: POR FUNCIÓN (--func)
+    # ---------------------------
+    if func_name:
+        # Estrategia: Buscar la definición de la función y subir buscando el decorador
+        target_def = f"def {func_name}("
+        
+        # Primero identificamos los índices de las líneas que queremos modificar
+        lines_to_modify = set()
+        
+        for i, line in enumerate(lines):
+            if target_def in line:
+                # Encontramos la función, buscamos hacia arriba el decorador @router
+                for j in range(i - 1, -1, -1):
+                    prev_line = lines[j].strip()
+                    if prev_line.startswith("@router.") or prev_line.startswith("@app."):
+                        # Encontramos el decorador
+                        lines_to_modify.add(j)
+                        break
+                    if prev_line == "" or prev_line.startswith("#"):
+                        continue
+                    # Si encontramos otra cosa que no sea decorador/comentario/vacío, paramos
+                    if not prev_line.startswith("@"):
+                        break
+        
+        if not lines_to_modify:
+            typer.echo(f"⚠️  No se encontró la función '{func_name}' o su decorador en {router_path}")
+        
+        # Aplicamos cambios
+        for i, line in enumerate(lines):
+            if i in lines_to_modify:
+                if "get_current_user" in line:
+                    new_lines.append(line) # Ya protegido
+                    continue
+                
+                if "dependencies=" in line:
+                    typer.echo(f"⚠️  Saltando línea (ya tiene dependencies): {line.strip()}")
+                    new_lines.append(line)
+                    continue
+
+                parts = line.rsplit(")", 1)
+                if len(parts) >= 2:
+                    line = parts[0] + ", dependencies=[Depends(get_current_user)])" + parts[1]
+                    changes_made = True
+            new_lines.append(line)
+
+    # ---------------------------
+    # MODO 2: POR ACCIÓN (action)
+    # ---------------------------
+    else:
+        # Define targets
+        targets = []
+        if action == "all":
+            targets = ["@router.get", "@router.post", "@router.put", "@router.patch", "@router.delete"]
+        else:
+            if action == "list": targets.append('@router.get("/",')
+            elif action == "create":
+                targets.append('@router.post("/",')
+                targets.append('@router.post("/bulk",')
+            elif action == "read": targets.append('@router.get("/{')
+            elif action == "update": 
+                targets.append('@router.patch("/{')
+                targets.append('@router.put("/{')
+                targets.append('@router.patch("/bulk",')
+            elif action == "delete":
+                targets.append('@router.delete("/{')
+                targets.append('@router.delete("/bulk",')
+            else:
+                typer.echo(f"❌ Acción desconocida: {action}")
+                raise typer.Exit(code=1)
+
+        for line in lines:
+            matched = False
+            for t in targets:
+                if t in line:
+                    # Check if already protected
+                    if "get_current_user" in line:
+                        matched = True 
+                        break
+                    
+                    if "dependencies=" in line:
+                        typer.echo(f"⚠️  Saltando línea (ya tiene dependencies): {line.strip()}")
+                        matched = True
+                        break
+                    else:
+                        parts = line.rsplit(")", 1)
+                        if len(parts) >= 2:
+                            line = parts[0] + ", dependencies=[Depends(get_current_user)])" + parts[1]
+                            changes_made = True
+                            matched = True
+                            break
+            new_lines.append(line)
+
+    if changes_made:
+        with open(router_path, "w") as f:
+            f.write("\n".join(new_lines))
+        typer.echo(f"✅ Rutas protegidas en {router_path}")
+    else:
+        typer.echo("ℹ️  No se hicieron cambios (¿ya estaban protegidas?)")
@@ -0,0 +1,151 @@
+"""crudfull sync-routers"""
+import os
+import typer
+from ..console import error
+from ..helpers import ROUTER_REGISTRY_PATH, write_router_registry
+from ..patcher import PatchError, PythonFile, has_root_endpoint, queue_routers, register_routers, use_router_registry
+
+# Trailing marker on the lines sync-routers adds
+CRUDFULL_COMMENT = "  # agregado por CRUDfull"
+
+# =====================================================================
+# AUTO-INTEGRACIÓN DEL ROUTER EN main.py
+# =====================================================================
+
+MAIN_CANDIDATES = [
+    "main.py",
+    os.path.join("app", "main.py"),
+    os.path.join("src", "main.py"),
+    os.path.join("api", "main.py"),
+]
+
+
+def find_or_create_main():
+    """
+    Busca un main.py en ubicaciones comunes.
+    Si no existe, crea uno nuevo en ./main.py.
+    """
+    for path in MAIN_CANDIDATES:
+        if os.path.exists(path):
+            return path
+
+    # Ninguno existe — creamos main.py en raíz
+    default_main = "main.py"
+    with open(default_main, "w") as f:
+        f.write(
+            "from fastapi import FastAPI\n\n"
+            "app = FastAPI()\n"
+        )
+    typer.echo("🆕 No se encontró main.py — creado automáticamente en ./main.py")
+    return default_main
+
+
+ROOT_ENDPOINT = (
+    '@app.get("/")\n'
+    "def root():\n"
+    '    return {"message": "🚀 CRUDfull FastAPI ready!"}\n'
+)
+
+
+def integrate_router_into_main(model_file: str):
+    """
+    Inserta automáticamente el import y app.include_router()
+    en el main.py correspondiente (y un endpoint raíz si falta),
+    con una sola lectura y una sola escritura.
+    """
+    main_path = find_or_create_main()
+
+    try:
+        source = PythonFile(main_path)
+    except PatchError as e:
+        error(f"❌ {e}")
+        raise typer.Exit(code=1)
+
+    queue_routers(source, [(f"{model_file}_router", f"routers.{model_file}_router")], comment=CRUDFULL_COMMENT)
+    add_root = not has_root_endpoint(source.tree)
+    if add_root:
+        source.insert(len(source.lines), "\n\n" + ROOT_ENDPOINT)
+
+    if source.save():
+        typer.echo(f"🔌 main.py actualizado automáticamente con el router: {model_file}_router")
+    if add_root:
+        typer.echo("🌟 Endpoint raíz agregado automáticamente: GET /")
+
+def find_all_routers():
+    """
+    Detecta todos los routers:
+    1. routers/*_router.py (Legacy/Flat)
+    2. app/*/router.py (Modular)
+    """
+    import glob
+    router_files = []
+
+    # 1. Legacy routers/*_router.py
+    routers_dir = os.path.join(os.getcwd(), "routers")
+    if os.path.exists(routers_dir):
+        for filename in os.listdir(routers_dir):
+            if filename.endswith("_router.py"):
+                name = filename.replace("_router.py", "")
+                router_files.append({
+                    "name": name,
+                    "type": "legacy",
+                    "module": f"routers.{name}_router"
+                })
+    
+    # 2. Modular app/*/router.py
+    pattern = os.path.join("app", "*", "router.py")
+    for router_file in sorted(glob.glob(pattern)):
+        # Extraer el nombre del módulo (ej: app/users/router.py -> users)
+        parts = router_file.split(os.sep)
+        if len(parts) >= 2:
+            module_name = parts[1]  # 'users' de app/users/router.py
+            router_files.append({
+                "name": module_name,
+                "type": "modular", # Added type for consistency with original structure
+                "module": f"app.{module_name}.router"
+            })
+    
+    return router_files
+
+def sync_routers(registry: bool = False):
+
+    typer.echo("🔎 Buscando routers...")
+
+    routers = find_all_routers()
+
+    if not routers:
+        typer.echo("❌ No se encontraron routers.")
+        raise typer.Exit()
+
+    router_names = [r["name"] for r in routers]
+    typer.echo(f"📡 Routers detectados: {', '.join(router_names)}")
+
+    main_path = find_or_create_main()
+    changed = []
+
+    try:
+        # Once app/routers.py exists, modular routers always go through it
+        if registry or os.path.exists(ROUTER_REGISTRY_PATH):
+            grouped = write_router_registry()
+            modules = {module for prefix_modules in grouped.values() for module in prefix_modules}
+            changed += use_router_registry(main_path, modules)
+            routers = [r for r in routers if r["module"] not in modules]
+            typer.echo(
+                f"🗂️  {ROUTER_REGISTRY_PATH} actualizado: {len(modules)} router(s) en {len(grouped)} prefijo(s)"
+            )
+
+        if routers:
+            changed += register_routers(
+                main_path,
+                [(f"{r['name']}_router", r["module"]) for r in routers],
+                comment=CRUDFULL_COMMENT,
+            )
+    except PatchError as e:
+        error(f"❌ {e}")
+        raise typer.Exit(code=1)
+
+    if changed:
+        typer.echo(f"🔧 main.py actualizado: {', '.join(changed)}")
+        typer.echo("🚀 main.py sincronizado con todos los routers!")
+    else:
+        typer.echo("✨ Todo estaba sincronizado. No hubo cambios.")
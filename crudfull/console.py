@@ -0,0 +1,20 @@
+"""Colored terminal output shared by every command."""
+import typer
+from .cli import LOGO
+
+ # Colored terminal helpers
+def success(msg: str):
+    typer.echo(f"\033[1;32m{msg}\033[0m")
+
+def warning(msg: str):
+    typer.echo(f"\033[1;33m{msg}\033[0m")
+
+def error(msg: str):
+    typer.echo(f"\033[1;31m{msg}\033[0m")
+
+
+# ===========================
+# LOGO
+# ===========================
+def show_logo():
+    typer.echo(LOGO)
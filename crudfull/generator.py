@@ -0,0 +1,454 @@
+"""Resource generation pipeline: parse field specs, render, write and register."""
+import os
+import typer
+from . import __version__
+from .console import error, success, warning
+from .helpers import add_models_to_session, add_requirement, add_routers_to_main
+from .manifest import Manifest, atomic_write, file_hash, sha256
+from .migrations import migrations_enabled, parse_table, write_migration_for
+from .patcher import PatchError
+from .rendering import get_template_env, render_template
+
+# Field modifiers accepted after the type: name:type!index!filter!sort
+FIELD_MODIFIERS = {"index", "filter", "sort"}
+
+
+# Per-resource settings accepted in a spec file (defaults: or inside each resource)
+SPEC_OPTIONS = {"page_size": 50, "max_page_size": 500, "bulk_batch_size": 500, "cache": False, "fast_json": False}
+
+CACHE_SETTINGS = """
+# Read-through cache (--cache, app/core/cache.py): memory | redis
+# memory is per worker process: with several workers the others serve stale
+# reads for up to CACHE_TTL seconds after a write. Use redis to share it.
+CACHE_BACKEND=memory
+CACHE_TTL=60
+CACHE_MAX_ENTRIES=10000
+REDIS_URL=redis://localhost:6379/0
+"""
+
+
+def load_spec(path: str) -> dict:
+    """Read a YAML or JSON spec file (YAML needs PyYAML: pip install crudfull[spec])."""
+    if not os.path.exists(path):
+        error(f"❌ No se encontró el archivo {path}")
+        raise typer.Exit(code=1)
+
+    with open(path, "r") as f:
+        raw = f.read()
+
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            error("❌ Para specs YAML instalá PyYAML: pip install crudfull[spec] (o usá JSON)")
+            raise typer.Exit(code=1)
+        parse, parse_error = yaml.safe_load, yaml.YAMLError
+    else:
+        import json
+        parse, parse_error = json.loads, json.JSONDecodeError
+
+    try:
+        spec = parse(raw)
+    except parse_error as e:
+        error(f"❌ Spec inválido: {e}")
+        raise typer.Exit(code=1)
+
+    if not isinstance(spec, dict) or not isinstance(spec.get("resources"), dict) or not spec["resources"]:
+        error("❌ El spec debe tener una sección 'resources' con al menos un recurso")
+        raise typer.Exit(code=1)
+    return spec
+
+
+def _spec_fields(name: str, fields) -> list[str]:
+    """Accept fields as {name: type} or as a list of 'name:type' strings."""
+    if isinstance(fields, dict):
+        return [f"{field}:{ftype}" for field, ftype in fields.items()]
+    if isinstance(fields, list) and all(isinstance(field, str) for field in fields):
+        return fields
+    error(f"❌ Recurso '{name}': 'fields' debe ser un mapa nombre: tipo o una lista nombre:tipo")
+    raise typer.Exit(code=1)
+
+
+def resolve_project_db(db: str | None) -> str:
+    """Use the explicit --db, else the one in crudfull.json, else sql."""
+    # Try to load config
+    config_path = os.path.join(os.getcwd(), "crudfull.json")
+    if db is None and os.path.exists(config_path):
+        import json
+        try:
+            with open(config_path, "r") as f:
+                config = json.load(f)
+                db = config.get("db")
+                typer.echo(f"⚙️  Usando configuración del proyecto: DB={db}")
+        except Exception:
+            pass
+    
+    if db is None:
+        db = "sql" # Default fallback
+    return db
+
+
+def resolve_project_fast_json(fast_json: bool | None) -> bool:
+    """Use the explicit --fast-json/--no-fast-json, else the project's setting (crudfull new --fast-json)."""
+    config_path = os.path.join(os.getcwd(), "crudfull.json")
+    if fast_json is None and os.path.exists(config_path):
+        import json
+        try:
+            with open(config_path, "r") as f:
+                fast_json = json.load(f).get("fast_json")
+        except Exception:
+            pass
+    return bool(fast_json)
+
+
+def resolve_jobs(jobs: int) -> int:
+    if jobs < 0:
+        error("❌ --jobs debe ser 0 (todos los CPUs) o mayor")
+        raise typer.Exit(code=1)
+    return jobs or os.cpu_count() or 1
+
+
+def validate_generation_options(page_size: int, max_page_size: int, bulk_batch_size: int):
+    if page_size < 1 or page_size > max_page_size:
+        error("❌ --page-size debe estar entre 1 y --max-page-size")
+        raise typer.Exit(code=1)
+
+    if bulk_batch_size < 1:
+        error("❌ --bulk-batch-size debe ser mayor que 0")
+        raise typer.Exit(code=1)
+
+
+# Templates rendered into app/<resource>/ for each engine
+RESOURCE_TEMPLATES = {
+    "sql": {
+        "schemas.py": "sql/schemas.jinja2",
+        "models.py": "sql/models.jinja2",
+        "service.py": "sql/service.jinja2",
+        "router.py": "sql/router.jinja2",
+        "repository.py": "sql/repository.jinja2",
+    },
+    "mongo": {
+        "schemas.py": "mongo/schemas.jinja2",
+        "models.py": "mongo/models.jinja2",
+        "service.py": "mongo/service.jinja2",
+        "router.py": "mongo/router.jinja2",
+        "repository.py": "mongo/repository.jinja2",
+    },
+    "ghost": {
+        "schemas.py": "ghost/schemas.jinja2",
+        "service.py": "ghost/service.jinja2",
+        "router.py": "ghost/router.jinja2",
+        "repository.py": "ghost/repository.jinja2",
+    },
+}
+
+
+# Plural endings that a bare "-s" strip gets wrong (addresses, boxes, categories, ...)
+_IRREGULAR_ENDINGS = ("ss", "us", "is", "ies", "ses", "xes", "zes", "ches", "shes", "oes", "ves")
+
+
+def singularize(word: str) -> str:
+    """Singular form of a resource name: products -> product, categories -> category.
+
+    Plain "-s" plurals are handled inline; everything else goes through
+    inflect, imported only then because importing it takes seconds.
+    """
+    if word.endswith("s") and not word.endswith(_IRREGULAR_ENDINGS):
+        return word[:-1]
+    import inflect
+
+    return inflect.engine().singular_noun(word) or word
+
+
+def build_resource_context(
+    name: str,
+    fields: list[str],
+    db: str,
+    page_size: int = 50,
+    max_page_size: int = 500,
+    bulk_batch_size: int = 500,
+    cache: bool = False,
+    fast_json: bool = False,
+) -> dict:
+    """Parse and validate the field specs and build the template context."""
+    if db not in RESOURCE_TEMPLATES:
+        typer.echo(f"❌ Motor {db} no soportado.")
+        raise typer.Exit(code=1)
+
+    # Parse fields (reuse logic or extract to helper)
+    parsed_fields = {}
+    has_optional = False
+    has_datetime = False
+    has_uuid = False
+
+    for field in fields:
+        if ":" not in field:
+            typer.echo(f"❌ Error en campo '{field}'. Formato válido: nombre:tipo")
+            raise typer.Exit(code=1)
+        
+        fname, ftype = field.split(":", 1)
+        is_optional = False
+
+        # Modifiers: nombre:tipo[?]!index!filter!sort
+        ftype, *modifiers = ftype.split("!")
+        if ftype.endswith("?") or (modifiers and modifiers[-1].endswith("?")):
+            is_optional = True
+            has_optional = True
+        ftype = ftype.rstrip("?")
+        modifiers = [m.rstrip("?") for m in modifiers]
+
+        unknown = set(modifiers) - FIELD_MODIFIERS
+        if unknown:
+            typer.echo(
+                f"❌ Modificador inválido en campo '{field}': {', '.join(sorted(unknown))}. "
+                f"Opciones: {', '.join(sorted(FIELD_MODIFIERS))}"
+            )
+            raise typer.Exit(code=1)
+        if "sort" in modifiers and is_optional:
+            # Keyset pagination compares (field, id): NULLs would break the cursor
+            typer.echo(f"❌ El campo '{fname}' no puede ser opcional y usar !sort")
+            raise typer.Exit(code=1)
+
+        if ftype == "datetime":
+            has_datetime = True
+        if ftype == "uuid":
+            has_uuid = True
+
+        parsed_fields[fname] = {
+            "type": ftype,
+            "optional": is_optional,
+            "index": "index" in modifiers,
+            "filter": "filter" in modifiers,
+            "sort": "sort" in modifiers,
+        }
+
+    filter_fields = [
+        {"name": fname, **fdata} for fname, fdata in parsed_fields.items() if fdata["filter"]
+    ]
+    sort_fields = [fname for fname, fdata in parsed_fields.items() if fdata["sort"]]
+    # Filter fields get an index too, so filtered reads never scan; sort fields
+    # are already covered by their leading (field, id) composite index
+    indexed_fields = [
+        fname for fname, fdata in parsed_fields.items()
+        if (fdata["index"] or fdata["filter"]) and not fdata["sort"]
+    ]
+
+    singular = singularize(name.lower()).capitalize()
+    resource = name.lower()
+
+    context = {
+        "name": name,           # As given on the command line
+        "model_name": singular, # Class name (User)
+        "resource": resource,   # URL prefix (users)
+        "singular": singular.lower(), # var name (user)
+        "fields": parsed_fields,
+        "filter_fields": filter_fields,
+        "sort_fields": sort_fields,
+        "indexed_fields": indexed_fields,
+        "has_optional": has_optional,
+        "has_datetime": has_datetime,
+        "has_uuid": has_uuid,
+        "page_size": page_size,
+        "max_page_size": max_page_size,
+        "bulk_batch_size": bulk_batch_size,
+        "cache": cache,
+        "fast_json": fast_json,
+        "db": db,
+    }
+    return context
+
+
+def render_resource(context: dict) -> list[tuple[str, str, str, bool]]:
+    """Render every file of a resource without touching the disk.
+
+    Returns (folder, file_name, content, overwrite) tuples in write order. Only
+    depends on the context, so it can run in a worker process.
+    """
+    resource = context["resource"]
+    rendered = [(os.path.join("app", resource), "__init__.py", "", True)]
+
+    files = dict(RESOURCE_TEMPLATES[context["db"]])
+    if context["cache"]:
+        files["cache.py"] = "cache/service.jinja2"
+        # Shared cache backends live in app/core/cache.py (generated once)
+        rendered.append((os.path.join("app", "core"), "__init__.py", "", False))
+        rendered.append((os.path.join("app", "core"), "cache.py", render_template("cache/backend.jinja2", context), False))
+    if context["fast_json"]:
+        # ModelResponse / model_response shared by every --fast-json router (generated once)
+        rendered.append((os.path.join("app", "core"), "__init__.py", "", False))
+        rendered.append((os.path.join("app", "core"), "responses.py", render_template("fast_json/responses.jinja2", context), False))
+
+    for filename, tpl_path in files.items():
+        rendered.append((os.path.join("app", resource), filename, render_template(tpl_path, context), True))
+
+    rendered.append((os.path.join("tests", resource), "__init__.py", "", True))
+    rendered.append((os.path.join("tests", resource), f"test_{resource}.py", render_template("test_resource.jinja2", context), True))
+    return rendered
+
+
+def resource_input_hash(context: dict) -> str:
+    """Hash of everything a resource is rendered from: context, template sources, version."""
+    import json
+
+    env = get_template_env()
+    names = [*RESOURCE_TEMPLATES[context["db"]].values(), "test_resource.jinja2"]
+    if context["cache"]:
+        names += ["cache/service.jinja2", "cache/backend.jinja2"]
+    if context["fast_json"]:
+        names.append("fast_json/responses.jinja2")
+    templates = {name: env.loader.get_source(env, name)[0] for name in names}
+    payload = {"version": __version__, "context": context, "templates": templates}
+    return sha256(json.dumps(payload, sort_keys=True, default=str))
+
+
+def write_resource(rendered: list[tuple[str, str, str, bool]], manifest: Manifest, force: bool = False) -> list[str]:
+    """Write a rendered resource, skipping identical files and keeping hand-edited ones.
+
+    Returns the paths owned by the resource (create-only shared files excluded).
+    """
+    owned, unchanged = [], 0
+    for folder, file_name, content, overwrite in rendered:
+        path = os.path.join(folder, file_name)
+        if overwrite:
+            owned.append(path)
+        new_hash = sha256(content)
+        current = file_hash(path)
+        if current == new_hash:
+            # Same bytes: leave the file (and its mtime) alone
+            manifest.record_file(path, new_hash)
+            unchanged += 1
+            continue
+        if current is not None:
+            if not overwrite:
+                continue
+            if current != manifest.recorded_hash(path) and not force:
+                warning(f"⚠️  {path} tiene cambios manuales: no se sobrescribe (usá --force)")
+                continue
+        atomic_write(path, content)
+        manifest.record_file(path, new_hash)
+        success(f"File generated: {os.path.join(os.getcwd(), path)}")
+    if unchanged:
+        typer.echo(f"   {unchanged} archivo(s) sin cambios")
+    return owned
+
+
+def _announce_resource(context: dict):
+    typer.echo(f"📦 Generando RECURSO (Modular): {context['name']} con motor: {context['db']}")
+
+
+def _resource_generated(context: dict):
+    resource = context["resource"]
+    typer.echo(f"\n🎉 Recurso '{context['name']}' generado exitosamente!")
+    typer.echo(f"📂 app/{resource}/ - Módulo completo")
+    typer.echo(f"📂 tests/{resource}/ - Tests")
+    typer.echo(f"📚 Docs: http://localhost:8000/docs")
+
+
+def _read_table(models_path: str) -> dict | None:
+    try:
+        return parse_table(models_path)
+    except PatchError as e:
+        warning(f"⚠️  {e}")
+        return None
+
+
+def write_schema_migration(changes: list[tuple[dict | None, dict | None]]) -> str | None:
+    """One Alembic revision for the tables created or changed by this run."""
+    created = [new["name"] for old, new in changes if new and old is None]
+    updated = [new["name"] for old, new in changes if new and old is not None]
+    message = "; ".join(
+        part for part in (
+            f"create {', '.join(created)}" if created else "",
+            f"update {', '.join(updated)}" if updated else "",
+        ) if part
+    )
+    slug = "_".join(message.replace(";", "").replace(",", "").split())[:40].rstrip("_")
+    try:
+        path = write_migration_for(changes, message, slug)
+    except PatchError as e:
+        warning(f"⚠️  No se generó la migración: {e}")
+        return None
+    if path:
+        success(f"🧬 Migración generada: {path}")
+        typer.echo("💡 Aplicala con: alembic upgrade head")
+    return path
+
+
+def generate_resources(
+    resources: list[tuple[str, list[str], dict]], db: str, jobs: int = 1, force: bool = False
+):
+    """Generate (name, fields, options) resources and register them all at once.
+
+    Resources whose inputs match .crudfull/manifest.json (and whose files were
+    not touched since) are skipped. With jobs > 1 templates are rendered in a
+    process pool; files are still written here, in input order, so the output
+    is byte-identical to jobs=1.
+    """
+    # Validate everything up front: worker processes only render
+    contexts = [build_resource_context(name, fields, db, **options) for name, fields, options in resources]
+    manifest = Manifest()
+
+    pending = []
+    for context in contexts:
+        input_hash = resource_input_hash(context)
+        if not force and manifest.resource_unchanged(context["resource"], input_hash):
+            typer.echo(f"⏭️  Recurso '{context['name']}' sin cambios")
+        else:
+            pending.append((context, input_hash))
+
+    # SQL projects with `crudfull add migrations`: diff each table before / after writing
+    schema_changes = [] if db == "sql" and migrations_enabled() else None
+
+    def write(context: dict, input_hash: str, rendered: list):
+        _announce_resource(context)
+        models_path = os.path.join("app", context["resource"], "models.py")
+        old_table = _read_table(models_path) if schema_changes is not None else None
+        paths = write_resource(rendered, manifest, force=force)
+        manifest.record_resource(context["resource"], input_hash, paths)
+        if schema_changes is not None:
+            schema_changes.append((old_table, _read_table(models_path)))
+        _resource_generated(context)
+
+    try:
+        if jobs > 1 and len(pending) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+                rendered = pool.map(render_resource, [context for context, _ in pending])
+                for (context, input_hash), files in zip(pending, rendered):
+                    write(context, input_hash, files)
+        else:
+            for context, input_hash in pending:
+                write(context, input_hash, render_resource(context))
+    finally:
+        # Keep what was written even if a later resource failed
+        manifest.save()
+        if schema_changes:
+            write_schema_migration(schema_changes)
+
+    generated = [(context["resource"], context["model_name"]) for context in contexts]
+    register_resources(generated, db)
+    if any(context["fast_json"] for context in contexts):
+        add_requirement("orjson")
+    if any(context["cache"] for context in contexts):
+        # CACHE_BACKEND=redis is picked at runtime, so the client must be installed
+        add_requirement("redis")
+        _add_cache_settings(".env.example")
+    return generated
+
+
+def _add_cache_settings(env_path: str):
+    if not os.path.exists(env_path):
+        return
+    with open(env_path, "r") as f:
+        content = f.read()
+    if "CACHE_BACKEND" not in content:
+        with open(env_path, "a") as f:
+            f.write(CACHE_SETTINGS)
+
+
+def register_resources(resources: list[tuple[str, str]], db: str):
+    """Register routers and (SQL / MongoDB) models once for all resources."""
+    add_routers_to_main([(resource, f"app.{resource}.router") for resource, _ in resources])
+    if db in ("sql", "mongo"):
+        add_models_to_session([(singular, f"app.{resource}.models") for resource, singular in resources])
@@ -0,0 +1,266 @@
+"""File writing and patching helpers for generated projects."""
+import os
+from .console import success, warning
+from .manifest import atomic_write, file_hash, sha256
+from .patcher import PatchError, model_classes, register_models, register_routers, router_prefix
+
+# ===========================
+# HELPERS
+# ===========================
+def write_file(folder: str, file_name: str, content: str):
+    output_dir = os.path.join(os.getcwd(), folder)
+    os.makedirs(output_dir, exist_ok=True)
+    file_path = os.path.join(output_dir, file_name)
+
+    atomic_write(file_path, content)
+
+    success(f"File generated: {file_path}")
+
+
+def add_requirement(package: str):
+    """Append a package to requirements.txt unless it is already listed."""
+    req_path = os.path.join(os.getcwd(), "requirements.txt")
+    if not os.path.exists(req_path):
+        warning(f"⚠️  No se encontró requirements.txt. Asegúrate de instalar: {package}")
+        return
+    with open(req_path, "r") as f:
+        content = f.read()
+    listed = {line.split("[")[0].split("=")[0].split(">")[0].strip().lower() for line in content.splitlines()}
+    if package.split("[")[0].lower() not in listed:
+        with open(req_path, "a") as f:
+            f.write(("" if content.endswith("\n") or not content else "\n") + f"{package}\n")
+        success(f"📦 Dependencia agregada a requirements.txt: {package}")
+
+
+def add_router_to_main(router_name: str, module_path: str):
+    """
+    Add a router import and include to main.py, keeping imports grouped together.
+    
+    Args:
+        router_name: Name of the router (e.g., 'auth', 'products')
+        module_path: Import path (e.g., 'app.auth.router', 'app.products.router')
+    """
+    add_routers_to_main([(router_name, module_path)])
+
+
+def add_routers_to_main(routers: list[tuple[str, str]]):
+    """
+    Register several routers in main.py with a single parse and write.
+
+    Projects using the router registry (app/routers.py) get the registry
+    regenerated instead; main.py is left alone.
+
+    Args:
+        routers: (router_name, module_path) pairs, in registration order
+    """
+    main_path = os.path.join("app", "main.py")
+    if not os.path.exists(main_path) or not routers:
+        return
+
+    if os.path.exists(ROUTER_REGISTRY_PATH):
+        write_router_registry()
+        for router_name, _ in routers:
+            success(f"Router '{router_name}' registered in {ROUTER_REGISTRY_PATH}")
+        return
+
+    names = {f"{router_name}_router": router_name for router_name, _ in routers}
+    try:
+        added = register_routers(main_path, [(f"{router_name}_router", module_path) for router_name, module_path in routers])
+    except PatchError as e:
+        warning(f"Could not update main.py: {e}")
+        return
+
+    for alias in added:
+        success(f"Router '{names[alias]}' auto-registered in main.py")
+
+
+ROUTER_REGISTRY_PATH = os.path.join("app", "routers.py")
+
+
+def find_modular_routers() -> dict[str, list[str]]:
+    """URL prefix -> router modules, for every app/<name>/router.py (read from its APIRouter(prefix=...))."""
+    import glob
+
+    grouped: dict[str, list[str]] = {}
+    for router_file in sorted(glob.glob(os.path.join("app", "*", "router.py"))):
+        module = f"app.{router_file.split(os.sep)[1]}.router"
+        try:
+            prefix = router_prefix(router_file)
+        except PatchError as e:
+            warning(f"Skipping {router_file}: {e}")
+            continue
+        # Group on the first path segment: /shop/items and /shop/orders load together
+        prefix = "/" + prefix.strip("/").split("/")[0] if prefix.strip("/") else ""
+        grouped.setdefault(prefix, []).append(module)
+    return grouped
+
+
+def write_router_registry() -> dict[str, list[str]]:
+    """Regenerate app/routers.py from the routers on disk (unchanged content is not rewritten)."""
+    from .rendering import render_template
+
+    routers = find_modular_routers()
+    content = render_template("project/routers.jinja2", {"routers": routers})
+    if file_hash(ROUTER_REGISTRY_PATH) != sha256(content):
+        atomic_write(ROUTER_REGISTRY_PATH, content)
+    return routers
+
+
+def add_model_to_session(model_name: str, module_path: str):
+    """
+    Add a model import to app/db/session.py for MongoDB projects.
+    
+    Args:
+        model_name: Name of the model class (e.g., 'User', 'Product')
+        module_path: Import path (e.g., 'app.auth.models', 'app.users.models')
+    """
+    add_models_to_session([(model_name, module_path)])
+
+
+MODELS_REGISTRY_PATH = os.path.join("app", "db", "models_registry.py")
+
+# Base classes of generated models: SQLAlchemy declarative Base, Beanie Document
+MODEL_BASES = ("Base", "Document")
+
+
+def find_models() -> list[tuple[str, str]]:
+    """(model_name, module_path) for every model class in app/*/models.py, in path order."""
+    import glob
+
+    models = []
+    for models_file in sorted(glob.glob(os.path.join("app", "*", "models.py"))):
+        module = f"app.{models_file.split(os.sep)[1]}.models"
+        try:
+            models += [(name, module) for name in model_classes(models_file, MODEL_BASES)]
+        except PatchError as e:
+            warning(f"Skipping {models_file}: {e}")
+    return models
+
+
+def write_models_registry() -> list[tuple[str, str]]:
+    """Regenerate app/db/models_registry.py from the models on disk (unchanged content is not rewritten)."""
+    from .rendering import render_template
+
+    models = find_models()
+    content = render_template(
+        "project/models_registry.jinja2",
+        {"models": [{"name": name, "module": module} for name, module in models]},
+    )
+    if file_hash(MODELS_REGISTRY_PATH) != sha256(content):
+        atomic_write(MODELS_REGISTRY_PATH, content)
+    return models
+
+
+def add_models_to_session(models: list[tuple[str, str]]):
+    """
+    Register several models with a single parse and write.
+
+    Projects with app/db/models_registry.py (SQL and MongoDB) get the registry
+    regenerated; older MongoDB projects get app/db/session.py patched.
+
+    Args:
+        models: (model_name, module_path) pairs, in registration order
+    """
+    if not models:
+        return
+
+    if os.path.exists(MODELS_REGISTRY_PATH):
+        registered = set(write_models_registry())
+        for model_name, module_path in models:
+            if (model_name, module_path) in registered:
+                success(f"Model '{model_name}' registered in {MODELS_REGISTRY_PATH}")
+        return
+
+    session_path = os.path.join("app", "db", "session.py")
+    if not os.path.exists(session_path):
+        return
+
+    try:
+        added = register_models(session_path, models)
+    except PatchError as e:
+        warning(f"Could not update session.py: {e}")
+        return
+
+    # None: not a MongoDB project, nothing to register
+    for model_name in added or []:
+        success(f"Model '{model_name}' auto-registered in app/db/session.py")
+
+
+
+# ---------------------------
+# Docker-compose helpers (.dev) non-invasive
+# ---------------------------
+def ensure_env_file(env_path: str, vars: dict):
+    """Create or update .env, adding missing variables (does not overwrite existing ones)."""
+    if os.path.exists(env_path):
+        with open(env_path, "r") as f:
+            content = f.read()
+        appended = False
+        with open(env_path, "a") as f:
+            for k, v in vars.items():
+                if k not in content:
+                    f.write(f"{k}={v}\n")
+                    appended = True
+        if appended:
+            warning(f"Updated variables in {env_path}")
+        else:
+            warning(f"{env_path} already contained all required variables")
+    else:
+        with open(env_path, "w") as f:
+            for k, v in vars.items():
+                f.write(f"{k}={v}\n")
+        success(f"{env_path} created")
+
+
+def ensure_compose_has_service(
+    compose_path: str,
+    service_key: str,
+    service_block: str,
+    volumes: list[str],
+):
+    """Add a service block to compose (non-invasive). If the service exists, do nothing.
+    If compose does not exist, create it with version 3.8 and the service.
+    """
+    if os.path.exists(compose_path):
+        with open(compose_path, "r") as f:
+            content = f.read()
+
+        if service_key in content:
+            warning(f"Service '{service_key}' already exists in {compose_path}")
+            # asegurar volúmenes
+            for v in volumes:
+                if v not in content:
+                    # si existe 'volumes:' lo añadimos al final
+                    if "\nvolumes:" in content:
+                        content = content + f"\n{v}:\n"
+                    else:
+                        content = content + f"\nvolumes:\n  {v}:\n"
+            with open(compose_path, "w") as f:
+                f.write(content)
+            return
+
+        # Servicio no está presente: lo agregamos justo antes del bloque 'volumes:' si existe, sino al final
+        if "\nvolumes:" in content:
+            parts = content.split("\nvolumes:")
+            new_content = parts[0].rstrip() + "\n\n" + service_block + "\n\nvolumes:" + parts[1]
+        else:
+            new_content = content.rstrip() + "\n\n" + service_block + "\n\nvolumes:\n"
+
+        # asegurar volúmenes listados
+        for v in volumes:
+            if v not in new_content:
+                new_content = new_content + f"  {v}:\n"
+
+        with open(compose_path, "w") as f:
+            f.write(new_content)
+
+        success(f"Service '{service_key}' added to {compose_path}")
+    else:
+        # crear nuevo compose con el servicio
+        base = "version: '3.8'\nservices:\n"
+        content = base + service_block + "\nvolumes:\n"
+        for v in volumes:
+            content += f"  {v}:\n"
+        with open(compose_path, "w") as f:
+            f.write(content)
+        success(f"{compose_path} created with service '{service_key}'")
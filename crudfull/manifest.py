@@ -0,0 +1,104 @@
+"""
+Content-hash manifest for incremental regeneration.
+
+`.crudfull/manifest.json` records, per resource, a hash of everything that
+went into rendering it (field specs, options, template sources, crudfull
+version) and, per generated file, the hash of what was written. With it the
+generator can skip untouched resources, leave identical files alone (no mtime
+change) and tell generated files apart from hand-edited ones.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+
+MANIFEST_PATH = os.path.join(".crudfull", "manifest.json")
+
+
+def sha256(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return sha256(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def atomic_write(path: str, content: str):
+    """Write through a temp file in the same directory and os.replace() it in,
+    so readers (uvicorn --reload, editors) never see a half-written file."""
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".crudfull-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        # mkstemp creates 0600 files: keep the target's mode, or the umask default
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _file_mode(path: str) -> int:
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _key(path: str) -> str:
+    # Stable across OSes: relative, forward slashes
+    return os.path.relpath(path).replace(os.sep, "/")
+
+
+class Manifest:
+    def __init__(self, path: str = MANIFEST_PATH):
+        self.path = path
+        self.resources: dict[str, dict] = {}
+        self.files: dict[str, str] = {}
+        self.dirty = False
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self.resources = data.get("resources", {})
+            self.files = data.get("files", {})
+
+    def recorded_hash(self, path: str) -> Optional[str]:
+        return self.files.get(_key(path))
+
+    def record_file(self, path: str, content_hash: str):
+        if self.files.get(_key(path)) != content_hash:
+            self.files[_key(path)] = content_hash
+            self.dirty = True
+
+    def resource_unchanged(self, resource: str, input_hash: str) -> bool:
+        """Same inputs as last time and every output still as generated."""
+        entry = self.resources.get(resource)
+        if entry is None or entry["input"] != input_hash:
+            return False
+        return all(file_hash(path) == self.files.get(path) for path in entry["files"])
+
+    def record_resource(self, resource: str, input_hash: str, paths: list[str]):
+        entry = {"input": input_hash, "files": [_key(path) for path in paths]}
+        if self.resources.get(resource) != entry:
+            self.resources[resource] = entry
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        from . import __version__
+
+        data = {"crudfull_version": __version__, "resources": self.resources, "files": self.files}
+        atomic_write(self.path, json.dumps(data, indent=2, sort_keys=True) + "\n")
+        self.dirty = False
@@ -0,0 +1,256 @@
+"""
+Alembic migrations for generated SQL projects.
+
+The schema is read with `ast` from the generated SQLAlchemy models
+(`app/*/models.py`): each Column(...) call is kept as source, so the emitted
+operations use exactly the types and options the model declares. Diffing the
+models before and after `generate resource` yields the operations of the next
+revision, without connecting to a database.
+
+Index names follow SQLAlchemy's defaults (ix_<table>_<column>), so databases
+created by `create_all` and by `alembic upgrade` end up identical.
+"""
+import ast
+import os
+from typing import Optional
+
+from .manifest import atomic_write, sha256
+from .patcher import PatchError, PythonFile
+
+MIGRATIONS_DIR = "migrations"
+VERSIONS_DIR = os.path.join(MIGRATIONS_DIR, "versions")
+
+
+def migrations_enabled() -> bool:
+    return os.path.isdir(VERSIONS_DIR)
+
+
+# ---------------------------
+# Reading the models
+# ---------------------------
+def _call_name(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Call):
+        func = node.func
+        return func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else None
+    return None
+
+
+def parse_table(models_path: str) -> Optional[dict]:
+    """
+    The table declared by the first model class with a __tablename__.
+
+    Returns:
+        {"name", "columns": {name: {"type", "kwargs"}}, "indexes": {name: {"columns", "unique"}},
+        "imports": [import statements from sqlalchemy]} or None if there is no table.
+    """
+    if not os.path.exists(models_path):
+        return None
+    source = PythonFile(models_path)
+    text = "".join(source.lines)
+
+    def src(node: ast.AST) -> str:
+        return ast.get_source_segment(text, node)
+
+    imports = [
+        src(node) for node in source.tree.body
+        if isinstance(node, ast.ImportFrom) and (node.module or "").split(".")[0] == "sqlalchemy"
+    ]
+    for node in source.tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        table = {"name": None, "columns": {}, "indexes": {}, "imports": imports}
+        for statement in node.body:
+            if not (isinstance(statement, ast.Assign) and isinstance(statement.targets[0], ast.Name)):
+                continue
+            target, value = statement.targets[0].id, statement.value
+            if target == "__tablename__" and isinstance(value, ast.Constant):
+                table["name"] = value.value
+            elif target == "__table_args__" and isinstance(value, ast.Tuple):
+                for element in value.elts:
+                    if _call_name(element) == "Index" and element.args and isinstance(element.args[0], ast.Constant):
+                        table["indexes"][element.args[0].value] = {
+                            "columns": [arg.value for arg in element.args[1:] if isinstance(arg, ast.Constant)],
+                            "unique": any(
+                                kw.arg == "unique" and isinstance(kw.value, ast.Constant) and kw.value.value
+                                for kw in element.keywords
+                            ),
+                        }
+            elif _call_name(value) == "Column" and value.args:
+                table["columns"][target] = {
+                    "type": src(value.args[0]),
+                    "kwargs": {kw.arg: src(kw.value) for kw in value.keywords if kw.arg},
+                }
+        if table["name"]:
+            return table
+    return None
+
+
+def project_tables() -> list[dict]:
+    """Tables of every app/*/models.py, in path order."""
+    import glob
+
+    tables = []
+    for models_path in sorted(glob.glob(os.path.join("app", "*", "models.py"))):
+        table = parse_table(models_path)
+        if table:
+            tables.append(table)
+    return tables
+
+
+# ---------------------------
+# Operations
+# ---------------------------
+def _nullable(column: dict) -> str:
+    kwargs = column["kwargs"]
+    return kwargs.get("nullable", "False" if kwargs.get("primary_key") == "True" else "True")
+
+
+def _column(name: str, column: dict) -> str:
+    """sa.Column(...) without index/unique: those become explicit indexes."""
+    kwargs = {k: v for k, v in column["kwargs"].items() if k != "index"}
+    if column["kwargs"].get("index") == "True":
+        kwargs.pop("unique", None)
+    args = [f'"{name}"', column["type"]] + [f"{k}={v}" for k, v in kwargs.items()]
+    return f"sa.Column({', '.join(args)})"
+
+
+def _column_indexes(table: dict) -> dict:
+    """Indexes SQLAlchemy derives from Column(index=True)."""
+    return {
+        f"ix_{table['name']}_{name}": {"columns": [name], "unique": column["kwargs"].get("unique") == "True"}
+        for name, column in table["columns"].items()
+        if column["kwargs"].get("index") == "True"
+    }
+
+
+def _all_indexes(table: dict) -> dict:
+    return {**_column_indexes(table), **table["indexes"]}
+
+
+def _create_index(name: str, index: dict, table: Optional[str] = None) -> str:
+    target = f'"{name}", "{table}", ' if table else f'"{name}", '
+    return f"create_index({target}{index['columns']!r}, unique={index['unique']})".replace("'", '"')
+
+
+def create_table_ops(table: dict) -> tuple[list[str], list[str]]:
+    columns = ",\n        ".join(_column(name, column) for name, column in table["columns"].items())
+    upgrade = [f'op.create_table(\n        "{table["name"]}",\n        {columns},\n    )']
+    upgrade += [f"op.{_create_index(name, index, table['name'])}" for name, index in _all_indexes(table).items()]
+    downgrade = [f'op.drop_table("{table["name"]}")']
+    return upgrade, downgrade
+
+
+def alter_table_ops(old: dict, new: dict) -> tuple[list[str], list[str]]:
+    """Column and index changes between two versions of a table, as batch operations."""
+    upgrade, downgrade = [], []
+    old_columns, new_columns = old["columns"], new["columns"]
+    old_indexes, new_indexes = _all_indexes(old), _all_indexes(new)
+    # A redefined index (other columns, unique flag) is dropped and created again
+    removed = sorted(name for name in old_indexes if old_indexes[name] != new_indexes.get(name))
+    added = sorted(name for name in new_indexes if new_indexes[name] != old_indexes.get(name))
+
+    for name in removed:
+        upgrade.append(f'batch_op.drop_index("{name}")')
+    for name, column in new_columns.items():
+        if name not in old_columns:
+            if _nullable(column) == "False":
+                upgrade.append("# NOT NULL column on an existing table: add a server_default or backfill first")
+            upgrade.append(f"batch_op.add_column({_column(name, column)})")
+            downgrade.insert(0, f'batch_op.drop_column("{name}")')
+        elif (column["type"], _nullable(column)) != (old_columns[name]["type"], _nullable(old_columns[name])):
+            before = old_columns[name]
+            upgrade.append(
+                f'batch_op.alter_column("{name}", existing_type={before["type"]}, type_={column["type"]}, '
+                f'existing_nullable={_nullable(before)}, nullable={_nullable(column)})'
+            )
+            downgrade.insert(0,
+                f'batch_op.alter_column("{name}", existing_type={column["type"]}, type_={before["type"]}, '
+                f'existing_nullable={_nullable(column)}, nullable={_nullable(before)})'
+            )
+    for name, column in old_columns.items():
+        if name not in new_columns:
+            upgrade.append(f'batch_op.drop_column("{name}")')
+            downgrade.insert(0, f"batch_op.add_column({_column(name, column)})")
+    for name in added:
+        upgrade.append(f"batch_op.{_create_index(name, new_indexes[name])}")
+    downgrade = [f'batch_op.drop_index("{name}")' for name in added] + downgrade
+    downgrade += [f"batch_op.{_create_index(name, old_indexes[name])}" for name in removed]
+
+    if not upgrade:
+        return [], []
+
+    def batch(lines: list[str]) -> str:
+        body = "\n".join(f"        {line}" for line in lines)
+        return f'with op.batch_alter_table("{new["name"]}") as batch_op:\n{body}'
+
+    return [batch(upgrade)], [batch(downgrade)]
+
+
+def table_ops(old: Optional[dict], new: Optional[dict]) -> tuple[list[str], list[str]]:
+    if new is None:
+        return [], []
+    if old is None:
+        return create_table_ops(new)
+    return alter_table_ops(old, new)
+
+
+# ---------------------------
+# Revisions
+# ---------------------------
+def head_revision() -> Optional[str]:
+    """The revision no other revision points to as down_revision."""
+    revisions, parents = set(), set()
+    for file_name in sorted(os.listdir(VERSIONS_DIR)):
+        if not file_name.endswith(".py"):
+            continue
+        try:
+            tree = PythonFile(os.path.join(VERSIONS_DIR, file_name)).tree
+        except PatchError:
+            continue
+        for node in tree.body:
+            if isinstance(node, (ast.Assign, ast.AnnAssign)):
+                target = node.targets[0] if isinstance(node, ast.Assign) else node.target
+                if isinstance(target, ast.Name) and isinstance(node.value, ast.Constant):
+                    if target.id == "revision":
+                        revisions.add(node.value.value)
+                    elif target.id == "down_revision" and node.value.value:
+                        parents.add(node.value.value)
+    heads = sorted(revisions - parents)
+    if len(heads) > 1:
+        raise PatchError(f"Hay más de un head en {VERSIONS_DIR} ({', '.join(heads)}): ejecutá 'alembic merge heads'")
+    return heads[0] if heads else None
+
+
+def write_revision(message: str, slug: str, upgrade: list[str], downgrade: list[str], imports: list[str]) -> str:
+    """Render a revision on top of the current head. Returns its path."""
+    from .rendering import render_template
+
+    down_revision = head_revision()
+    body = "\n".join(upgrade) + "\n".join(downgrade)
+    # Deterministic id: same history + same changes -> same revision
+    revision = sha256(f"{down_revision}:{message}:{body}")[:12]
+    content = render_template("migrations/revision.jinja2", {
+        "message": message,
+        "revision": revision,
+        "down_revision": down_revision,
+        "imports": sorted(set(imports)),
+        "upgrade": upgrade,
+        "downgrade": downgrade,
+    })
+    path = os.path.join(VERSIONS_DIR, f"{revision}_{slug}.py")
+    atomic_write(path, content)
+    return path
+
+
+def write_migration_for(changes: list[tuple[Optional[dict], Optional[dict]]], message: str, slug: str) -> Optional[str]:
+    """One revision with the operations for every (old, new) table pair; None if nothing changed."""
+    upgrade, downgrade, imports = [], [], []
+    for old, new in changes:
+        up, down = table_ops(old, new)
+        if up:
+            upgrade += up
+            downgrade = down + downgrade
+            imports += new["imports"]
+    if not upgrade:
+        return None
+    return write_revision(message, slug, upgrade, downgrade, imports)
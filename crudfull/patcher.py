@@ -0,0 +1,375 @@
+"""
+AST-based patching of generated entry files (app/main.py, app/db/session.py).
+
+Each target is read and parsed once. Registrations are located from the
+syntax tree, so multi-line `app = FastAPI(...)` calls and example code in
+comments do not confuse them, queued as line edits and written back in a
+single atomic write, only when something is missing. Presence checks look at
+the parsed imports and calls, so applying the same batch twice is a no-op.
+"""
+import ast
+from typing import Optional
+
+from .manifest import atomic_write
+
+
+class PatchError(Exception):
+    """The target file does not parse or lacks the expected structure."""
+
+
+class PythonFile:
+    """A parsed Python source plus a batch of pending line edits."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "r") as f:
+            source = f.read()
+        try:
+            self.tree = ast.parse(source, filename=path)
+        except SyntaxError as e:
+            raise PatchError(f"{path} no es Python válido (línea {e.lineno}): {e.msg}") from e
+        self.lines = source.splitlines(keepends=True)
+        self._edits: list[tuple[int, int, str]] = []
+
+    def insert(self, index: int, text: str):
+        """Insert text (whole lines) before the 0-based line `index`."""
+        self._edits.append((index, index, text))
+
+    def replace(self, start: int, end: int, text: str):
+        """Replace the 0-based lines [start, end) with text."""
+        self._edits.append((start, end, text))
+
+    def render(self) -> str:
+        out, pos = [], 0
+        # Stable sort: edits at the same line keep the order they were queued in
+        for start, end, text in sorted(self._edits, key=lambda edit: edit[:2]):
+            out.extend(self.lines[pos:start])
+            if text:
+                if out and not out[-1].endswith("\n"):
+                    out.append("\n")
+                out.append(text)
+            pos = max(pos, end)
+        out.extend(self.lines[pos:])
+        return "".join(out)
+
+    def save(self) -> bool:
+        """Write all pending edits at once. Returns whether the file changed."""
+        if not self._edits:
+            return False
+        atomic_write(self.path, self.render())
+        self._edits = []
+        return True
+
+
+def _block(lines: list[str]) -> str:
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _start(node: ast.stmt) -> int:
+    """0-based first line of a statement, decorators included."""
+    return min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])]) - 1
+
+
+def _app_assignment(tree: ast.Module) -> Optional[ast.Assign]:
+    """The top-level `<name> = FastAPI(...)` statement."""
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Name)
+            and node.value.func.id == "FastAPI"
+            and isinstance(node.targets[0], ast.Name)
+        ):
+            return node
+    return None
+
+
+def _is_include(node: ast.AST, app_name: str) -> bool:
+    """`<app_name>.include_router(<name>, ...)`"""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "include_router"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == app_name
+        and bool(node.args)
+        and isinstance(node.args[0], ast.Name)
+    )
+
+
+def _import_anchor(imports: list[ast.stmt]) -> int:
+    """Line index after the last router import, else the last `app.*` import, else the last import."""
+    router_imports = [
+        node for node in imports
+        if isinstance(node, ast.ImportFrom) and any(alias.name == "router" and alias.asname for alias in node.names)
+    ]
+    app_imports = [
+        node for node in imports if isinstance(node, ast.ImportFrom) and (node.module or "").startswith("app.")
+    ]
+    anchor = (router_imports or app_imports or imports or [None])[-1]
+    return anchor.end_lineno if anchor else 0
+
+
+def _insert_after_app(source: PythonFile, app_node: Optional[ast.Assign], includes: list[ast.stmt], lines: list[str]):
+    """After the last top-level include, else after the whole `app = FastAPI(...)`, else at the end."""
+    if includes:
+        source.insert(includes[-1].end_lineno, _block(lines))
+    elif app_node:
+        source.insert(app_node.end_lineno, "\n" + _block(lines))
+    else:
+        source.insert(len(source.lines), "\n" + _block(lines))
+
+
+def register_routers(main_path: str, routers: list[tuple[str, str]], comment: str = "") -> list[str]:
+    """Parse main.py, queue every missing router registration and write once."""
+    source = PythonFile(main_path)
+    added = queue_routers(source, routers, comment)
+    source.save()
+    return added
+
+
+def queue_routers(source: PythonFile, routers: list[tuple[str, str]], comment: str = "") -> list[str]:
+    """
+    Queue the import and include of a `router` object per module in a FastAPI entry file.
+
+    Imports go after the last router import (else the last `app.*` import, else
+    the last import); includes go after the last top-level include_router call,
+    else right after the whole `app = FastAPI(...)` statement, else at the end.
+
+    Args:
+        source: Parsed main.py
+        routers: (alias, module_path) pairs, e.g. ('products_router', 'app.products.router')
+        comment: Trailing comment for every added line (e.g. '  # agregado por CRUDfull')
+
+    Returns:
+        The aliases that were missing an import or an include, in input order.
+    """
+    tree = source.tree
+    routers = list(dict.fromkeys(routers))
+
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    imported = {
+        (node.module, alias.name, alias.asname or alias.name)
+        for node in imports if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    app_node = _app_assignment(tree)
+    app_name = app_node.targets[0].id if app_node else "app"
+    top_level_includes = [node for node in tree.body if isinstance(node, ast.Expr) and _is_include(node.value, app_name)]
+    # Includes nested in if/try blocks count too; imports and plain calls need no walk
+    nested = (
+        node for statement in tree.body
+        if not isinstance(statement, (ast.Expr, ast.Import, ast.ImportFrom))
+        for node in ast.walk(statement)
+    )
+    included = {node.value.args[0].id for node in top_level_includes}
+    included |= {node.args[0].id for node in nested if _is_include(node, app_name)}
+
+    new_imports = [(alias, module) for alias, module in routers if (module, "router", alias) not in imported]
+    new_includes = [alias for alias, _ in routers if alias not in included]
+
+    if new_imports:
+        source.insert(
+            _import_anchor(imports),
+            _block([f"from {module} import router as {alias}{comment}" for alias, module in new_imports]),
+        )
+
+    if new_includes:
+        _insert_after_app(
+            source, app_node, top_level_includes,
+            [f"{app_name}.include_router({alias}){comment}" for alias in new_includes],
+        )
+
+    added = {alias for alias, _ in new_imports} | set(new_includes)
+    return [alias for alias, _ in routers if alias in added]
+
+
+def use_router_registry(main_path: str, modules: set[str], registry: str = "app.routers") -> list[str]:
+    """
+    Swap the per-resource router imports and includes of `modules` in main.py
+    for a single `include_routers(app)` from the generated registry module.
+
+    Returns:
+        The router aliases that were moved out of main.py.
+    """
+    source = PythonFile(main_path)
+    tree = source.tree
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    app_node = _app_assignment(tree)
+    app_name = app_node.targets[0].id if app_node else "app"
+    top_level_includes = [node for node in tree.body if isinstance(node, ast.Expr) and _is_include(node.value, app_name)]
+
+    moved = []
+    for node in imports:
+        if (
+            isinstance(node, ast.ImportFrom)
+            and node.module in modules
+            and [alias.name for alias in node.names] == ["router"]
+        ):
+            moved.append(node.names[0].asname or "router")
+            source.replace(_start(node), node.end_lineno, "")
+    for node in top_level_includes:
+        if node.value.args[0].id in moved:
+            source.replace(_start(node), node.end_lineno, "")
+
+    has_import = any(
+        isinstance(node, ast.ImportFrom) and node.module == registry
+        and any(alias.name == "include_routers" and not alias.asname for alias in node.names)
+        for node in imports
+    )
+    if not has_import:
+        source.insert(_import_anchor(imports), f"from {registry} import include_routers\n")
+
+    has_call = any(
+        isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Name) and node.value.func.id == "include_routers"
+        for node in tree.body
+    )
+    if not has_call:
+        _insert_after_app(source, app_node, top_level_includes, [f"include_routers({app_name})"])
+
+    source.save()
+    return moved
+
+
+def has_root_endpoint(tree: ast.Module) -> bool:
+    """Whether main.py defines `root()` or a `@<app>.get("/")` route."""
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if node.name == "root":
+            return True
+        for decorator in node.decorator_list:
+            if (
+                isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Attribute)
+                and decorator.func.attr == "get"
+                and decorator.args
+                and isinstance(decorator.args[0], ast.Constant)
+                and decorator.args[0].value == "/"
+            ):
+                return True
+    return False
+
+
+def _is_model_import(node: ast.stmt) -> bool:
+    return isinstance(node, ast.ImportFrom) and (node.module or "").startswith("app.") and node.module.endswith(".models")
+
+
+def _document_models_assignment(tree: ast.Module) -> Optional[ast.Assign]:
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "document_models"
+        ):
+            return node
+    return None
+
+
+def is_beanie_session(tree: ast.Module) -> bool:
+    return any(
+        isinstance(node, ast.ImportFrom) and (node.module or "").split(".")[0] == "beanie"
+        for node in tree.body
+    )
+
+
+def register_models(session_path: str, models: list[tuple[str, str]], replace: bool = False) -> Optional[list[str]]:
+    """
+    Import Beanie models in session.py and rebuild `document_models = [...]` from them.
+
+    Args:
+        session_path: Path to app/db/session.py
+        models: (model_name, module_path) pairs, e.g. ('Product', 'app.products.models')
+        replace: Drop `app.*.models` imports that are not in `models` (sync-models)
+
+    Returns:
+        The newly imported model names, or None if the file is not a Beanie session.
+
+    Raises:
+        PatchError: session.py does not parse or has no `document_models` assignment.
+    """
+    source = PythonFile(session_path)
+    tree = source.tree
+    if not is_beanie_session(tree):
+        return None
+
+    document_models = _document_models_assignment(tree)
+    if document_models is None:
+        raise PatchError(f"No se encontró 'document_models = ...' en {session_path}")
+
+    models = list(dict.fromkeys(models))
+    model_imports = [node for node in tree.body if _is_model_import(node)]
+    existing = [(alias.asname or alias.name, node.module) for node in model_imports for alias in node.names]
+
+    registered = models if replace else existing + [model for model in models if model not in existing]
+    new_models = [model for model in registered if model not in existing]
+    to_import = new_models
+    if replace and registered != existing:
+        # Rewrite the whole import block in the requested order
+        for node in model_imports:
+            source.replace(node.lineno - 1, node.end_lineno, "")
+        to_import = registered
+
+    if to_import:
+        lines = [f"from {module} import {name}" for name, module in to_import]
+        if model_imports:
+            index = model_imports[0].lineno - 1 if replace else model_imports[-1].end_lineno
+            source.insert(index, _block(lines))
+        else:
+            # Right before the first definition (init_db), after the comment block
+            definitions = [
+                node for node in tree.body
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+            ]
+            if definitions:
+                source.insert(_start(definitions[0]), _block(lines) + "\n")
+            else:
+                source.insert(len(source.lines), _block(lines))
+
+    names = [name for name, _ in registered]
+    current = document_models.value
+    if not (
+        isinstance(current, ast.List)
+        and [element.id if isinstance(element, ast.Name) else None for element in current.elts] == names
+    ):
+        line = source.lines[document_models.lineno - 1]
+        indent = line[: len(line) - len(line.lstrip())]
+        source.replace(
+            document_models.lineno - 1,
+            document_models.end_lineno,
+            f"{indent}document_models = [{', '.join(names)}]  # Auto-registered models\n",
+        )
+
+    source.save()
+    return [name for name, _ in new_models]
+
+
+def model_classes(models_path: str, bases: tuple[str, ...] = ("Document",)) -> list[str]:
+    """Top-level classes in a models.py that directly inherit from one of `bases` (Document, Base)."""
+    tree = PythonFile(models_path).tree
+    return [
+        node.name for node in tree.body
+        if isinstance(node, ast.ClassDef)
+        and any(
+            (isinstance(base, ast.Name) and base.id in bases)
+            or (isinstance(base, ast.Attribute) and base.attr in bases)
+            for base in node.bases
+        )
+    ]
+
+
+def router_prefix(router_path: str) -> str:
+    """The literal `prefix=` of the module-level `router = APIRouter(...)`, or ''."""
+    tree = PythonFile(router_path).tree
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "router"
+            and isinstance(node.value, ast.Call)
+        ):
+            for keyword in node.value.keywords:
+                if keyword.arg == "prefix" and isinstance(keyword.value, ast.Constant):
+                    return str(keyword.value.value)
+    return ""
@@ -0,0 +1,40 @@
+"""Jinja2 environment used to render every template (imported only by commands that render)."""
+import os
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from . import __version__
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+_template_env = None
+
+
+def template_cache_dir() -> str:
+    """Bytecode cache directory, one per crudfull version so upgrades never reuse stale code."""
+    base = os.getenv("CRUDFULL_CACHE_DIR") or os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "crudfull"
+    )
+    return os.path.join(base, "templates", __version__)
+
+
+def get_template_env() -> Environment:
+    """Shared Jinja2 environment: templates are parsed and compiled once per process,
+    and the compiled code is kept on disk between runs."""
+    global _template_env
+    if _template_env is None:
+        bytecode_cache = None
+        if os.getenv("CRUDFULL_NO_CACHE", "").lower() not in ("1", "true", "yes"):
+            try:
+                os.makedirs(template_cache_dir(), exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(template_cache_dir())
+            except OSError:
+                pass  # Read-only home: render without the on-disk cache
+        _template_env = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+        )
+    return _template_env
+
+
+def render_template(path: str, context: dict) -> str:
+    return get_template_env().get_template(path).render(context)
@@ -0,0 +1,113 @@
+"""
+Boot probe run by `crudfull profile startup` in a fresh interpreter.
+
+    python -X importtime -m crudfull.startup_probe app.main:app [--no-lifespan]
+
+Imports the app, times the route table build (every APIRouter.add_api_route
+call made while importing), the middleware stack, the OpenAPI schema and the
+lifespan startup/shutdown (init_db on its own when main.py imports it), and
+prints the timings as one JSON line prefixed with RESULT_MARKER. Only the
+standard library is imported before FastAPI and the app (both counted in
+import_ms).
+"""
+import asyncio
+import importlib
+import json
+import sys
+import time
+
+RESULT_MARKER = "__crudfull_startup__ "
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1e3, 3)
+
+
+class _Timer:
+    """Accumulates the time spent in a function, counting only outermost calls."""
+
+    def __init__(self, func):
+        self.func = func
+        self.total = 0.0
+        self.calls = 0
+        self._depth = 0
+
+    def wrap(self):
+        timer = self
+
+        def wrapper(*args, **kwargs):
+            timer._depth += 1
+            start = time.perf_counter()
+            try:
+                return timer.func(*args, **kwargs)
+            finally:
+                timer._depth -= 1
+                if timer._depth == 0:
+                    timer.total += time.perf_counter() - start
+                    timer.calls += 1
+
+        return wrapper
+
+
+def _timed_async(func, timings: dict, key: str):
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            timings[key] = _ms(time.perf_counter() - start)
+
+    return wrapper
+
+
+async def _run_lifespan(app, module, timings: dict):
+    if callable(getattr(module, "init_db", None)):
+        module.init_db = _timed_async(module.init_db, timings, "init_db_ms")
+    before = set(sys.modules)
+    context = app.router.lifespan_context(app)
+    start = time.perf_counter()
+    await context.__aenter__()
+    timings["lifespan_startup_ms"] = _ms(time.perf_counter() - start)
+    timings["lifespan_imported_modules"] = sorted(set(sys.modules) - before)
+    start = time.perf_counter()
+    await context.__aexit__(None, None, None)
+    timings["lifespan_shutdown_ms"] = _ms(time.perf_counter() - start)
+
+
+def main(argv: list[str]) -> int:
+    target = argv[0] if argv else "app.main:app"
+    module_name, _, attr = target.partition(":")
+    result: dict = {"target": target}
+
+    start = time.perf_counter()
+    from fastapi.routing import APIRouter
+
+    route_timer = _Timer(APIRouter.add_api_route)
+    APIRouter.add_api_route = route_timer.wrap()
+
+    module = importlib.import_module(module_name)
+    app = getattr(module, attr or "app")
+    result["import_ms"] = _ms(time.perf_counter() - start)
+    result["route_build_ms"] = _ms(route_timer.total)
+    APIRouter.add_api_route = route_timer.func
+
+    result["routes"] = len(app.routes)
+    start = time.perf_counter()
+    app.build_middleware_stack()
+    result["middleware_ms"] = _ms(time.perf_counter() - start)
+    start = time.perf_counter()
+    app.openapi()
+    result["openapi_ms"] = _ms(time.perf_counter() - start)
+
+    if "--no-lifespan" not in argv:
+        try:
+            asyncio.run(_run_lifespan(app, module, result))
+        except Exception as e:  # report it, the import numbers are still useful
+            result["lifespan_error"] = f"{type(e).__name__}: {e}"
+
+    print(RESULT_MARKER + json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
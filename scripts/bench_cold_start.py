@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold start of a generated app with many resources.
+
+Generates a ghost project with N resources, then measures in fresh
+interpreters the time to import app.main and serve the first request with:
+  - one import + include_router per resource in main.py (default)
+  - the app/routers.py registry (`sync-routers run --registry`), eager
+  - the registry with LAZY_ROUTERS=true
+
+Usage:
+  python scripts/bench_cold_start.py [--resources 150] [--runs 5]
+
+Requires: typer, jinja2, inflect, fastapi, httpx
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--resources", type=int, default=150)
+parser.add_argument("--runs", type=int, default=5)
+args = parser.parse_args()
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENV = {**os.environ, "PYTHONPATH": ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")}
+
+# Runs inside the generated project: import, then first request through the ASGI stack
+PROBE = """
+import json, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(app)
+client_ready = time.perf_counter()
+assert client.get("/items0").status_code == 200
+done = time.perf_counter()
+print(json.dumps({"import_ms": (imported - start) * 1e3, "first_request_ms": (done - client_ready) * 1e3}))
+"""
+
+
+def crudfull(*argv: str, cwd: str):
+    subprocess.run([sys.executable, "-m", "crudfull", *argv], cwd=cwd, env=ENV, check=True, stdout=subprocess.DEVNULL)
+
+
+def probe(cwd: str, lazy: bool) -> dict:
+    env = {**ENV, "PYTHONPATH": cwd, "LAZY_ROUTERS": "true" if lazy else "false"}
+    samples = []
+    for _ in range(args.runs):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=cwd, env=env, check=True, capture_output=True, text=True
+        )
+        samples.append(json.loads(result.stdout.splitlines()[-1]))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        spec_path = os.path.join(workdir, "schema.json")
+        with open(spec_path, "w") as f:
+            json.dump({"resources": {f"items{i}": {"fields": ["name:str", "price:float"]} for i in range(args.resources)}}, f)
+
+        crudfull("new", "bench", "--db", "ghost", cwd=workdir)
+        per_resource = os.path.join(workdir, "bench")
+        crudfull("generate", "from-spec", spec_path, cwd=per_resource)
+
+        registry = os.path.join(workdir, "bench_registry")
+        shutil.copytree(per_resource, registry)
+        crudfull("sync-routers", "run", "--registry", cwd=registry)
+
+        print(f"resources={args.resources} runs={args.runs} (medians)")
+        print(f"{'layout':<26} {'import app.main':>16} {'first request':>14} {'total':>9}")
+        for label, cwd, lazy in (
+            ("main.py, one per resource", per_resource, False),
+            ("registry, eager", registry, False),
+            ("registry, LAZY_ROUTERS", registry, True),
+        ):
+            result = probe(cwd, lazy)
+            total = result["import_ms"] + result["first_request_ms"]
+            print(f"{label:<26} {result['import_ms']:13.1f} ms {result['first_request_ms']:11.1f} ms {total:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
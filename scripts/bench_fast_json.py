@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark --fast-json against the default response path.
+
+Generates two SQL projects (SQLite) with the same resource, one with
+`crudfull new --fast-json`, seeds both with the same rows, then measures
+req/s of the list and read endpoints, calling the ASGI app in-process (no
+network). Rounds alternate between the two projects and the medians are
+reported, so machine noise hits both sides alike:
+  - default: response_model validation + stdlib json encoding
+  - --fast-json: rows validated once, JSON written by pydantic-core
+
+Usage:
+  python scripts/bench_fast_json.py [--rows 2000] [--limit 500] [--rounds 7] [--seconds 1]
+
+Requires: typer, jinja2, inflect, fastapi, sqlalchemy, aiosqlite, httpx, orjson
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--rows", type=int, default=2000)
+parser.add_argument("--limit", type=int, default=500)
+parser.add_argument("--rounds", type=int, default=7)
+parser.add_argument("--seconds", type=float, default=1.0)
+args = parser.parse_args()
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENV = {**os.environ, "PYTHONPATH": ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")}
+FIELDS = ["name:str", "price:float", "stock:int", "description:str?", "created:datetime"]
+
+# Runs inside the generated project: seed on the first run, warm up, then count
+# requests for a fixed time
+PROBE = """
+import asyncio, json, sys, time
+import httpx
+from app.main import app
+from app.db.session import init_db
+
+ROWS, LIMIT, SECONDS, SEED = int(sys.argv[1]), int(sys.argv[2]), float(sys.argv[3]), sys.argv[4] == "seed"
+
+async def rate(client, path):
+    for _ in range(50):
+        assert (await client.get(path)).status_code == 200
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < SECONDS:
+        await client.get(path)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+async def main():
+    await init_db()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        items = [
+            {"name": f"item {i}", "price": i * 1.5, "stock": i, "description": "x" * 40,
+             "created": "2024-01-01T00:00:00"}
+            for i in range(ROWS)
+        ]
+        for start in range(0, ROWS if SEED else 0, 500):
+            assert (await client.post("/items/bulk", json=items[start:start + 500])).status_code == 200
+        print(json.dumps({
+            "list": await rate(client, f"/items/?limit={LIMIT}"),
+            "read": await rate(client, "/items/1"),
+        }))
+
+asyncio.run(main())
+"""
+
+
+def crudfull(*argv: str, cwd: str):
+    subprocess.run([sys.executable, "-m", "crudfull", *argv], cwd=cwd, env=ENV, check=True, stdout=subprocess.DEVNULL)
+
+
+def probe(cwd: str, seed: bool) -> dict:
+    env = {**ENV, "PYTHONPATH": cwd, "DATABASE_URL": f"sqlite+aiosqlite:///{cwd}/bench.db"}
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, str(args.rows), str(args.limit), str(args.seconds), "seed" if seed else "-"],
+        cwd=cwd, env=env, check=True, capture_output=True, text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        projects = {}
+        for label, extra in (("default", []), ("--fast-json", ["--fast-json"])):
+            name = "bench_fast" if extra else "bench"
+            crudfull("new", name, "--db", "sql", *extra, cwd=workdir)
+            projects[label] = os.path.join(workdir, name)
+            crudfull("generate", "resource", "items", *FIELDS, cwd=projects[label])
+
+        samples = {label: [] for label in projects}
+        for round_number in range(args.rounds):
+            for label, cwd in projects.items():
+                samples[label].append(probe(cwd, seed=round_number == 0))
+
+        results = {
+            label: {key: statistics.median(sample[key] for sample in runs) for key in runs[0]}
+            for label, runs in samples.items()
+        }
+        base = results["default"]
+        print(f"rows={args.rows} limit={args.limit} rounds={args.rounds}x{args.seconds}s (medians, in-process ASGI, SQLite)")
+        print(f"{'':<14} {f'GET /items/?limit={args.limit}':>24} {'GET /items/1':>16}")
+        for label, result in results.items():
+            print(
+                f"{label:<14} {result['list']:15.0f} req/s ({result['list'] / base['list']:.2f}x)"
+                f" {result['read']:8.0f} req/s ({result['read'] / base['read']:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
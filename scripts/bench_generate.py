@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark total `crudfull generate resource` time for N resources.
+
+Compares the previous renderer (a new Jinja2 Environment per template) with the
+shared environment, both with an empty and with a warm on-disk bytecode cache
+(the warm case is what a second CLI process sees, e.g. the next CI job).
+
+Usage:
+  python scripts/bench_generate.py [--resources 200] [--db sql]
+
+Requires: typer, jinja2, inflect
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from jinja2 import Environment, FileSystemLoader  # noqa: E402
+from typer.testing import CliRunner  # noqa: E402
+
+from crudfull import generator, rendering  # noqa: E402
+from crudfull.app import app  # noqa: E402
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--resources", type=int, default=200)
+parser.add_argument("--db", choices=["ghost", "sql", "mongo"], default="sql")
+args = parser.parse_args()
+
+FIELDS = ["name:str", "price:float", "stock:int?", "status:str!filter", "created:datetime!sort"]
+
+
+def fresh_env_render(path: str, context: dict) -> str:
+    """Previous implementation: templates re-read, parsed and compiled on every call."""
+    template_dir = os.path.join(rendering.TEMPLATES_DIR, os.path.dirname(path))
+    env = Environment(loader=FileSystemLoader(template_dir))
+    return env.get_template(os.path.basename(path)).render(context)
+
+
+def run(label: str, workdir: str) -> float:
+    project = os.path.join(workdir, label.replace(" ", "_"))
+    os.makedirs(project)
+    os.chdir(project)
+    CliRunner().invoke(app, ["new", "bench", "--db", args.db])
+    os.chdir(os.path.join(project, "bench"))
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.generate_resources([(f"items{i}", FIELDS, {}) for i in range(args.resources)], args.db)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} total={elapsed:8.3f}s  per resource={elapsed / args.resources * 1e3:7.2f} ms")
+    return elapsed
+
+
+def main():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ["CRUDFULL_CACHE_DIR"] = os.path.join(workdir, "cache")
+        print(f"resources={args.resources} db={args.db}")
+        generator.singularize("categories")  # load inflect outside the timings
+
+        original = generator.render_template
+        generator.render_template = fresh_env_render
+        before = run("fresh env per call", workdir)
+        generator.render_template = original
+
+        rendering._template_env = None
+        cold = run("shared env, cold cache", workdir)
+
+        # A new process would start with no in-memory templates, only the disk cache
+        rendering._template_env = None
+        warm = run("shared env, warm cache", workdir)
+        os.chdir(cwd)
+
+    print(f"speedup                cold=x{before / cold:.1f}  warm=x{before / warm:.1f}")
+
+
+if __name__ == "__main__":
+    main()
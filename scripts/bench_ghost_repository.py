@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark the generated ghost repository against the previous list-based one.
+
+Renders a ghost resource with the generator itself (build_resource_context +
+render_resource) into a temporary package, loads N rows and times point
+reads, updates and deletes. The "sorted" run uses a resource with two !sort
+fields, so updates and deletes also maintain the ?sort= indexes.
+
+Usage:
+  python scripts/bench_ghost_repository.py [--rows 100000] [--ops 2000]
+
+Requires: typer, jinja2, inflect, pydantic
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--rows", type=int, default=100_000)
+parser.add_argument("--ops", type=int, default=2_000)
+args = parser.parse_args()
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from crudfull.generator import build_resource_context, render_resource  # noqa: E402
+
+FIELDS = ["name:str", "price:float"]
+SORTED_FIELDS = ["name:str!sort", "price:float!sort"]
+
+
+class ListRepository:
+    """Previous implementation: rows kept in a plain list and scanned linearly."""
+
+    def __init__(self):
+        self.items = []
+        self.auto_id = 1
+
+    async def create(self, item):
+        obj = item.model_dump()
+        obj["id"] = self.auto_id
+        self.auto_id += 1
+        self.items.append(obj)
+        return obj
+
+    async def get(self, id):
+        for item in self.items:
+            if item["id"] == id:
+                return item
+        return None
+
+    async def update(self, id, item):
+        for idx, existing in enumerate(self.items):
+            if existing["id"] == id:
+                updated = {**existing, **item.model_dump(exclude_unset=True)}
+                self.items[idx] = updated
+                return updated
+        return None
+
+    async def delete(self, id):
+        for idx, existing in enumerate(self.items):
+            if existing["id"] == id:
+                return self.items.pop(idx)
+        return None
+
+
+def load_generated_package(tmp_dir: str, resource: str, fields: list):
+    # Same context and files as `crudfull generate resource <resource> <fields>`
+    context = build_resource_context(resource, fields, "ghost")
+    for folder, file_name, content, _ in render_resource(context):
+        os.makedirs(os.path.join(tmp_dir, folder), exist_ok=True)
+        with open(os.path.join(tmp_dir, folder, file_name), "w") as f:
+            f.write(content)
+    open(os.path.join(tmp_dir, "app", "__init__.py"), "w").close()
+    if tmp_dir not in sys.path:
+        sys.path.insert(0, tmp_dir)
+    return (
+        importlib.import_module(f"app.{resource}.schemas"),
+        importlib.import_module(f"app.{resource}.repository"),
+    )
+
+
+async def bench(label: str, repo, create_model, update_model):
+    rng = random.Random(42)
+    for _ in range(args.rows):
+        await repo.create(create_model(name=f"item-{rng.randrange(args.rows)}", price=rng.random()))
+
+    update = update_model(name="updated", price=2.0)
+    ids = rng.sample(range(1, args.rows + 1), args.ops)
+
+    results = {}
+    for op in ("get", "update", "delete"):
+        start = time.perf_counter()
+        for id in ids:
+            if op == "update":
+                await repo.update(id, update)
+            else:
+                await getattr(repo, op)(id)
+        results[op] = (time.perf_counter() - start) / args.ops * 1e6
+
+    print(f"{label:<8} " + "  ".join(f"{op}={us:10.2f} µs/op" for op, us in results.items()))
+    return results
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        schemas, repository = load_generated_package(tmp_dir, "items", FIELDS)
+        sorted_schemas, sorted_repository = load_generated_package(tmp_dir, "products", SORTED_FIELDS)
+        print(f"rows={args.rows} ops={args.ops}")
+        before = await bench("list", ListRepository(), schemas.ItemCreate, schemas.ItemUpdate)
+        after = await bench("dict", repository.ItemRepository(), schemas.ItemCreate, schemas.ItemUpdate)
+        await bench(
+            "sorted", sorted_repository.ProductRepository(), sorted_schemas.ProductCreate, sorted_schemas.ProductUpdate
+        )
+        print("speedup  " + "  ".join(f"{op}=x{before[op] / after[op]:.0f}" for op in before))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
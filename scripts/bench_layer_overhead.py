@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request cost of the generated SQL repository/service layer.
+
+Generates a SQL project (SQLite) with one resource, then reads the same row
+through `Service(get_repository(db)).read(id)` (what FastAPI resolves per
+request, minus the optional cache wrapper) and through the equivalent raw
+SQLAlchemy SELECT. Rounds alternate between the two paths and the medians
+are reported, so machine noise hits both sides alike.
+
+Usage:
+  python scripts/bench_layer_overhead.py [--reads 500] [--rounds 7] [--budget-us 500]
+
+Exits with status 1 when the median overhead exceeds --budget-us.
+
+Requires: typer, jinja2, inflect, fastapi, sqlalchemy, aiosqlite
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--reads", type=int, default=500)
+parser.add_argument("--rounds", type=int, default=7)
+parser.add_argument("--budget-us", type=float, default=500.0)
+args = parser.parse_args()
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENV = {**os.environ, "PYTHONPATH": ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")}
+FIELDS = ["name:str", "price:float", "stock:int"]
+
+# Runs inside the generated project
+PROBE = """
+import asyncio, json, sys, time
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.db.session import Base
+from app.items.models import Item
+from app.items.router import get_repository
+from app.items.schemas import ItemCreate
+from app.items.service import ItemService
+
+READS, ROUNDS = int(sys.argv[1]), int(sys.argv[2])
+
+async def raw(db, id):
+    start = time.perf_counter()
+    for _ in range(READS):
+        (await db.execute(select(Item).where(Item.id == id))).scalars().first()
+    return (time.perf_counter() - start) / READS
+
+async def layered(db, id):
+    start = time.perf_counter()
+    for _ in range(READS):
+        await ItemService(get_repository(db)).read(id)
+    return (time.perf_counter() - start) / READS
+
+async def main():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        obj = await get_repository(db).create(ItemCreate(name="bench", price=1.0, stock=1))
+        # Warm up statement compilation caches for both paths
+        for _ in range(20):
+            await db.execute(select(Item).where(Item.id == obj.id))
+            await ItemService(get_repository(db)).read(obj.id)
+        samples = {"raw": [], "layered": []}
+        for _ in range(ROUNDS):
+            samples["raw"].append(await raw(db, obj.id))
+            samples["layered"].append(await layered(db, obj.id))
+    await engine.dispose()
+    print(json.dumps(samples))
+
+asyncio.run(main())
+"""
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        subprocess.run([sys.executable, "-m", "crudfull", "new", "bench", "--db", "sql"],
+                       cwd=workdir, env=ENV, check=True, stdout=subprocess.DEVNULL)
+        project = os.path.join(workdir, "bench")
+        subprocess.run([sys.executable, "-m", "crudfull", "generate", "resource", "items", *FIELDS],
+                       cwd=project, env=ENV, check=True, stdout=subprocess.DEVNULL)
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE, str(args.reads), str(args.rounds)],
+            cwd=project, env={**ENV, "PYTHONPATH": project}, check=True, capture_output=True, text=True,
+        )
+        samples = json.loads(result.stdout.splitlines()[-1])
+
+    raw = statistics.median(samples["raw"]) * 1e6
+    layered = statistics.median(samples["layered"]) * 1e6
+    overhead = layered - raw
+    print(f"reads={args.reads} rounds={args.rounds} (medians, SQLite in-memory)")
+    print(f"raw SELECT            {raw:8.1f} µs/read")
+    print(f"service + repository  {layered:8.1f} µs/read")
+    print(f"overhead              {overhead:8.1f} µs/request (budget {args.budget_us:.0f} µs)")
+    if overhead > args.budget_us:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
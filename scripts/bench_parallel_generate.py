@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark `crudfull generate from-spec --jobs N` scaling.
+
+Writes a spec with N resources, runs the real CLI once per --jobs value in a
+fresh project and checks that every run produced byte-identical files.
+
+Usage:
+  python scripts/bench_parallel_generate.py [--resources 150] [--jobs 1 2 4 8] [--db sql]
+
+Requires: typer, jinja2, inflect
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--resources", type=int, default=150)
+parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8])
+parser.add_argument("--db", choices=["ghost", "sql", "mongo"], default="sql")
+args = parser.parse_args()
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENV = {**os.environ, "PYTHONPATH": ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")}
+SPEC = {
+    "resources": {
+        f"items{i}": {
+            "fields": ["name:str", "price:float", "stock:int?", "status:str!filter", "created:datetime!sort"],
+            "cache": i % 2 == 0,
+        }
+        for i in range(args.resources)
+    }
+}
+
+
+def crudfull(*argv: str, cwd: str):
+    subprocess.run([sys.executable, "-m", "crudfull", *argv], cwd=cwd, env=ENV, check=True, stdout=subprocess.DEVNULL)
+
+
+def tree_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    for folder, dirs, files in sorted(os.walk(path)):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(folder, name)
+            digest.update(os.path.relpath(file_path, path).encode())
+            with open(file_path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        ENV["CRUDFULL_CACHE_DIR"] = os.path.join(workdir, "cache")
+        spec_path = os.path.join(workdir, "schema.json")
+        with open(spec_path, "w") as f:
+            json.dump(SPEC, f)
+
+        print(f"resources={args.resources} db={args.db} cpus={os.cpu_count()}")
+        crudfull("cache", "precompile", cwd=workdir)
+
+        baseline, digests = None, set()
+        for jobs in args.jobs:
+            parent = os.path.join(workdir, f"j{jobs}")
+            os.makedirs(parent)
+            crudfull("new", "bench", "--db", args.db, cwd=parent)
+            cwd = os.path.join(parent, "bench")
+
+            start = time.perf_counter()
+            crudfull("generate", "from-spec", spec_path, "--jobs", str(jobs), cwd=cwd)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+
+            digests.add(tree_digest(cwd))
+            print(f"jobs={jobs:<3} total={elapsed:7.3f}s  speedup=x{baseline / elapsed:.2f}")
+
+        print("output identical across runs:", len(digests) == 1)
+        if len(digests) != 1:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark `crudfull sync-routers` patching of main.py with hundreds of routers.
+
+Compares the previous text-based patcher (one `in` scan of the whole file and
+one scan of its lines per router) with the AST-based single-pass patcher, on
+an empty main.py (every router missing) and on an already synced one (no-op).
+
+Usage:
+  python scripts/bench_patch_main.py [--routers 100 300 1000] [--repeat 5]
+
+Requires: nothing beyond crudfull itself
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from crudfull.patcher import register_routers  # noqa: E402
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--routers", type=int, nargs="+", default=[100, 300, 1000])
+parser.add_argument("--repeat", type=int, default=5)
+args = parser.parse_args()
+
+COMMENT = "  # agregado por CRUDfull"
+MAIN = '''from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from app.db.session import init_db
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    yield
+
+app = FastAPI(
+    title="bench",
+    lifespan=lifespan
+)
+
+
+@app.get("/")
+async def root():
+    return {"ok": True}
+'''
+
+
+def legacy_sync(main_path: str, routers: list[tuple[str, str]]):
+    """Previous implementation of sync-routers, kept here for comparison."""
+    with open(main_path, "r") as f:
+        content = f.read()
+
+    lines = content.splitlines()
+    modified = False
+    for name, module_path in routers:
+        import_line = f"from {module_path} import router as {name}{COMMENT}"
+        include_line = f"app.include_router({name}){COMMENT}"
+        if import_line not in content:
+            insert_idx = 0
+            for i, line in enumerate(lines):
+                if line.startswith("from ") or line.startswith("import "):
+                    insert_idx = i + 1
+            lines.insert(insert_idx, import_line)
+            modified = True
+        if include_line not in content:
+            for i, line in enumerate(lines):
+                if "app = FastAPI" in line.replace(" ", ""):
+                    lines.insert(i + 1, include_line)
+                    break
+            else:
+                lines.append(include_line)
+            modified = True
+
+    if modified:
+        with open(main_path, "w") as f:
+            f.write("\n".join(lines))
+
+
+def ast_sync(main_path: str, routers: list[tuple[str, str]]):
+    register_routers(main_path, routers, comment=COMMENT)
+
+
+def best_of(patch, main_path: str, routers, synced: bool) -> float:
+    """Best time over --repeat runs, starting from a fresh or an already synced main.py."""
+    times = []
+    for _ in range(args.repeat):
+        with open(main_path, "w") as f:
+            f.write(MAIN)
+        if synced:
+            patch(main_path, routers)
+        start = time.perf_counter()
+        patch(main_path, routers)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        main_path = os.path.join(workdir, "main.py")
+        print(f"{'routers':>8} {'case':<8} {'legacy':>10} {'ast':>10} {'speedup':>8}")
+        for count in args.routers:
+            routers = [(f"items{i}_router", f"app.items{i}.router") for i in range(count)]
+            for case, synced in (("fresh", False), ("synced", True)):
+                legacy = best_of(legacy_sync, main_path, routers, synced)
+                ast_ms = best_of(ast_sync, main_path, routers, synced)
+                print(f"{count:>8} {case:<8} {legacy:8.2f}ms {ast_ms:8.2f}ms {legacy / ast_ms:7.1f}x")
+
+            # The AST patcher's output must import cleanly and stay put on a second run
+            with open(main_path, "w") as f:
+                f.write(MAIN)
+            ast_sync(main_path, routers)
+            with open(main_path) as f:
+                first = f.read()
+            compile(first, main_path, "exec")
+            ast_sync(main_path, routers)
+            with open(main_path) as f:
+                if f.read() != first:
+                    sys.exit("AST patcher is not idempotent")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark crudfull CLI startup.
+
+Runs each command in a fresh interpreter under `python -X importtime`, reports
+the median wall time, the crudfull import time on top of a bare interpreter and
+the heaviest imports, and fails if `version show` goes over its budget.
+
+Usage:
+  python scripts/bench_startup.py [--runs 10] [--budget-ms 100] [--top 8]
+
+Requires: typer
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--runs", type=int, default=10)
+parser.add_argument("--budget-ms", type=float, default=100.0, help="Max extra ms for `version show`")
+parser.add_argument("--top", type=int, default=8)
+args = parser.parse_args()
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENV = {**os.environ, "PYTHONPATH": ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")}
+
+COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "version show": ["-m", "crudfull", "version", "show"],
+    "--help": ["-m", "crudfull", "--help"],
+    "generate --help": ["-m", "crudfull", "generate", "resource", "--help"],
+}
+
+
+def wall_ms(argv: list[str]) -> float:
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *argv], env=ENV, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(samples)
+
+
+def top_imports(argv: list[str]) -> list[tuple[int, str]]:
+    """(cumulative us, module) for top-level imports, heaviest first."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        env=ENV, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented: keep only the top-level ones
+        if not name.startswith("  "):
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)
+
+
+def main():
+    print(f"runs={args.runs} python={sys.version.split()[0]}")
+    baseline = None
+    for label, argv in COMMANDS.items():
+        elapsed = wall_ms(argv)
+        baseline = baseline if baseline is not None else elapsed
+        print(f"{label:<18} median={elapsed:7.1f} ms  over interpreter={elapsed - baseline:7.1f} ms")
+        if label == "version show":
+            version_overhead = elapsed - baseline
+
+    for label in ("version show", "--help"):
+        print(f"\nheaviest imports for `{label}`:")
+        for cumulative, name in top_imports(COMMANDS[label])[:args.top]:
+            print(f"  {cumulative / 1e3:8.1f} ms  {name}")
+
+    print(f"\nversion show budget: {version_overhead:.1f} ms / {args.budget_ms:.0f} ms")
+    if version_overhead > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()